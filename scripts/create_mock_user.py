@@ -14,6 +14,7 @@ Usage:
 
 import argparse
 import base64
+import functools
 import hashlib
 import hmac
 import json
@@ -22,12 +23,14 @@ import random
 import sys
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import httpx
 import requests
-from requests.adapters import HTTPAdapter
+from urllib3.filepost import encode_multipart_formdata
 from urllib3.util.retry import Retry
 
 # Add src to path for imports
@@ -35,18 +38,14 @@ project_root = Path(__file__).parent.parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
-from common.aws_lambdas.core_types.profile import (
-    BodyType,
-    EggplantSizeType,
-    HealthPracticesType,
-    HivStatusType,
-    HostingType,
-    PeachShapeType,
-    PreventionPracticesType,
-    SexualPosition,
-    SexualityType,
-    TravelDistanceType,
-)
+_rng = random.Random()
+_SHA256 = hashlib.sha256
+
+
+@functools.lru_cache(maxsize=4)
+def _secret_key(bot_token: str) -> bytes:
+    """Derive the Telegram WebApp secret key for a bot token (cached per token)"""
+    return hmac.new(b"WebAppData", bot_token.encode(), _SHA256).digest()
 
 
 class TelegramSignatureGenerator:
@@ -73,31 +72,20 @@ class TelegramSignatureGenerator:
             "auth_date": str(auth_date)
         }
         
-        # Create data check string
-        data_params_string = "\n".join(
-            f"{k}={v}" for k, v in sorted(params.items())
-        )
+        items = sorted(params.items())
+        
+        # Create data check string directly as bytes
+        data_check = b"\n".join(f"{k}={v}".encode() for k, v in items)
         
         # Generate secret key
-        secret_key = hmac.new(
-            "WebAppData".encode(), bot_token.encode(), hashlib.sha256
-        ).digest()
+        secret_key = _secret_key(bot_token)
         
         # Calculate hash
-        calculated_hash = hmac.new(
-            secret_key, data_params_string.encode(), hashlib.sha256
-        ).hexdigest()
-        
-        # Add hash to params
-        params["hash"] = calculated_hash
-        
-        # URL encode the params
-        init_data_parts = []
-        for key, value in params.items():
-            encoded_value = urllib.parse.quote(value, safe="")
-            init_data_parts.append(f"{key}={encoded_value}")
-            
-        return "&".join(init_data_parts)
+        calculated_hash = hmac.new(secret_key, data_check, _SHA256).hexdigest()
+        
+        # URL encode the params with the hash appended
+        items.append(("hash", calculated_hash))
+        return urllib.parse.urlencode(items, quote_via=urllib.parse.quote, safe="")
 
 
 class MockDataGenerator:
@@ -134,13 +122,50 @@ class MockDataGenerator:
         "Creative soul with a technical mind. Best of both worlds! 🎭💻"
     ]
     
+    _ENUM_CHOICES: Optional[Dict[str, tuple]] = None
+    
+    @classmethod
+    def _enums(cls) -> Dict[str, tuple]:
+        """Profile enum values keyed by profile field (imported and built on first use)"""
+        if cls._ENUM_CHOICES is None:
+            from common.aws_lambdas.core_types.profile import (
+                BodyType,
+                EggplantSizeType,
+                HealthPracticesType,
+                HivStatusType,
+                HostingType,
+                PeachShapeType,
+                PreventionPracticesType,
+                SexualPosition,
+                SexualityType,
+                TravelDistanceType,
+            )
+            
+            enum_fields = {
+                "sexualPosition": SexualPosition,
+                "bodyType": BodyType,
+                "sexualityType": SexualityType,
+                "eggplantSize": EggplantSizeType,
+                "peachShape": PeachShapeType,
+                "healthPractices": HealthPracticesType,
+                "hivStatus": HivStatusType,
+                "preventionPractices": PreventionPracticesType,
+                "hosting": HostingType,
+                "travelDistance": TravelDistanceType,
+            }
+            cls._ENUM_CHOICES = {
+                field: tuple(member.value for member in enum_type)
+                for field, enum_type in enum_fields.items()
+            }
+        return cls._ENUM_CHOICES
+    
     @classmethod
     def generate_telegram_user(cls) -> Dict[str, Any]:
         """Generate random Telegram user data"""
-        user_id = random.randint(100000000, 999999999)
-        first_name = random.choice(cls.FIRST_NAMES)
-        last_name = random.choice(cls.LAST_NAMES)
-        username = f"{random.choice(cls.USERNAMES)}{random.randint(1, 999)}"
+        user_id = _rng.randint(100000000, 999999999)
+        first_name = _rng.choice(cls.FIRST_NAMES)
+        last_name = _rng.choice(cls.LAST_NAMES)
+        username = f"{_rng.choice(cls.USERNAMES)}{_rng.randint(1, 999)}"
         
         return {
             "id": user_id,
@@ -155,24 +180,17 @@ class MockDataGenerator:
     @classmethod
     def generate_profile_data(cls) -> Dict[str, Any]:
         """Generate random profile data"""
-        first_name = random.choice(cls.FIRST_NAMES)
-        age = random.randint(18, 45)
+        first_name = _rng.choice(cls.FIRST_NAMES)
+        age = _rng.randint(18, 45)
         
-        return {
+        profile_data = {
             "nickName": first_name,
-            "aboutMe": random.choice(cls.BIO_TEMPLATES),
+            "aboutMe": _rng.choice(cls.BIO_TEMPLATES),
             "age": str(age),
-            "sexualPosition": random.choice(list(SexualPosition)).value,
-            "bodyType": random.choice(list(BodyType)).value,
-            "sexualityType": random.choice(list(SexualityType)).value,
-            "eggplantSize": random.choice(list(EggplantSizeType)).value,
-            "peachShape": random.choice(list(PeachShapeType)).value,
-            "healthPractices": random.choice(list(HealthPracticesType)).value,
-            "hivStatus": random.choice(list(HivStatusType)).value,
-            "preventionPractices": random.choice(list(PreventionPracticesType)).value,
-            "hosting": random.choice(list(HostingType)).value,
-            "travelDistance": random.choice(list(TravelDistanceType)).value,
         }
+        for field, choices in cls._enums().items():
+            profile_data[field] = _rng.choice(choices)
+        return profile_data
 
 
 class ImageService:
@@ -184,31 +202,55 @@ class ImageService:
         "https://via.placeholder.com/800x600/4A90E2/FFFFFF?text=Profile+{}",
     ]
     
+    MIN_IMAGE_SIZE = 1024  # At least 1KB
+    MAX_IMAGE_SIZE = 10485760  # Backend media_max_file_size
+    DOWNLOAD_CHUNK_SIZE = 65536
+    
+    @classmethod
+    def _download_image(cls, url: str) -> Optional[bytes]:
+        """Stream an image, rejecting it early when its size is out of range"""
+        with requests.get(url, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            
+            # Check the declared size before reading the body
+            declared_size = int(response.headers.get("Content-Length") or 0)
+            if declared_size and not cls.MIN_IMAGE_SIZE <= declared_size <= cls.MAX_IMAGE_SIZE:
+                print(f"    Skipping download, declared size out of range: {declared_size} bytes")
+                return None
+            
+            content = bytearray()
+            for chunk in response.iter_content(chunk_size=cls.DOWNLOAD_CHUNK_SIZE):
+                content += chunk
+                if len(content) > cls.MAX_IMAGE_SIZE:
+                    print(f"    Downloaded content too large: over {cls.MAX_IMAGE_SIZE} bytes")
+                    return None
+        
+        # Verify we got actual image content
+        if len(content) < cls.MIN_IMAGE_SIZE:
+            print(f"    Downloaded content too small: {len(content)} bytes")
+            return None
+        return bytes(content)
+    
     @classmethod
     def download_random_image(cls, user_id: int) -> bytes:
         """Download a random image for profile"""
         # Use user_id as seed for consistent but random images
-        random.seed(user_id)
+        rng = random.Random(user_id)
         
         # Try multiple services if one fails
         services = cls.IMAGE_SERVICES.copy()
-        random.shuffle(services)
+        rng.shuffle(services)
         
         for service_template in services:
             service_url = service_template.format(user_id)
             try:
                 print(f"    Trying to download from: {service_url}")
-                response = requests.get(service_url, timeout=15)
-                response.raise_for_status()
-                
-                # Verify we got actual image content
-                content = response.content
-                if len(content) > 1024:  # At least 1KB
-                    print(f"    Successfully downloaded {len(content)} bytes")
-                    return content
-                else:
-                    print(f"    Downloaded content too small: {len(content)} bytes")
+                content = cls._download_image(service_url)
+                if content is None:
                     continue
+                
+                print(f"    Successfully downloaded {len(content)} bytes")
+                return content
                     
             except Exception as e:
                 print(f"    Failed to download from {service_url}: {e}")
@@ -224,8 +266,7 @@ class ImageService:
         try:
             # Try to generate a simple colored image using placeholder service
             colors = ["FF6B6B", "4ECDC4", "45B7D1", "96CEB4", "FECA57", "FF9FF3", "54A0FF"]
-            random.seed(user_id)
-            color = random.choice(colors)
+            color = random.Random(user_id).choice(colors)
             fallback_url = f"https://via.placeholder.com/800x600/{color}/FFFFFF?text=User+{user_id}"
             
             response = requests.get(fallback_url, timeout=10)
@@ -237,6 +278,15 @@ class ImageService:
             # Return minimal PNG header - this should fail gracefully in the backend
             return b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x03 \x00\x00\x02X\x08\x02\x00\x00\x00\xd5\x94\x8e\xcf\x00\x00\x00\x19tEXtSoftware\x00Adobe ImageReadyq\xc9e<\x00\x00\x00\x0eIDATx\xdac\xf8\x0f\x00\x00\x01\x00\x01\x00\x00\x00\x00IEND\xaeB`\x82'
     
+    # JSON form of create_media_metadata(), filled in with the image size
+    MEDIA_METADATA_TEMPLATE = '{{"size":{},"format":"jpeg","width":800,"height":600}}'
+    
+    @classmethod
+    def encode_media_blob(cls, image_data: bytes) -> str:
+        """Encode image metadata as the base64 mediaBlob expected by the API"""
+        metadata_json = cls.MEDIA_METADATA_TEMPLATE.format(len(image_data))
+        return base64.b64encode(metadata_json.encode()).decode()
+    
     @classmethod
     def create_media_metadata(cls, image_data: bytes) -> Dict[str, Any]:
         """Create metadata for uploaded image"""
@@ -248,26 +298,83 @@ class ImageService:
         }
 
 
+# Status retry policy for API and S3 calls (urllib3 Retry semantics)
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 1
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+
+
+class _RetryTransport(httpx.BaseTransport):
+    """httpx transport that retries throttled/5xx responses like urllib3's Retry
+    
+    httpx.HTTPTransport(retries=...) only retries failed connections. This adds
+    status retries for the idempotent methods urllib3's Retry covers, with
+    exponential backoff and Retry-After.
+    """
+    
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        retry_status = request.method in Retry.DEFAULT_ALLOWED_METHODS
+        for attempt in range(RETRY_TOTAL + 1):
+            response = self._transport.handle_request(request)
+            if (
+                not retry_status
+                or attempt == RETRY_TOTAL
+                or response.status_code not in RETRY_STATUS_FORCELIST
+            ):
+                return response
+            retry_after = response.headers.get("Retry-After", "")
+            response.close()
+            delay = RETRY_BACKOFF_FACTOR * (2 ** attempt)
+            if retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            time.sleep(delay)
+    
+    def close(self) -> None:
+        self._transport.close()
+
+
 class VibeAPIClient:
     """Client for interacting with the Vibe Dating Backend API"""
     
-    def __init__(self, base_url: str):
+    S3_UPLOAD_ATTEMPTS = 3
+    
+    def __init__(self, base_url: str, pool_size: int = 10):
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
+        # Token from the last authenticate_user call; methods take a per-call
+        # jwt_token instead when one client is shared by several users
         self.jwt_token: Optional[str] = None
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+        # Multiplex concurrent API calls over one HTTP/2 connection
+        # (hosts without HTTP/2, such as S3, negotiate HTTP/1.1 via ALPN)
+        limits = httpx.Limits(
+            max_connections=pool_size, max_keepalive_connections=pool_size
+        )
+        transport = httpx.HTTPTransport(
+            http2=True, retries=RETRY_TOTAL, limits=limits
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.session = httpx.Client(transport=_RetryTransport(transport), timeout=30)
+    
+    def _auth_headers(self, jwt_token: Optional[str] = None) -> Dict[str, str]:
+        """Request headers for an authenticated user"""
+        jwt_token = jwt_token or self.jwt_token
+        if not jwt_token:
+            raise Exception("Not authenticated. Call authenticate_user first.")
+        
+        return {
+            "Authorization": f"Bearer {jwt_token}",
+            "Content-Type": "application/json"
+        }
     
     def authenticate_user(self, telegram_user: Dict[str, Any], bot_token: str) -> Dict[str, Any]:
-        """Authenticate user with Telegram data"""
+        """Authenticate user with Telegram data
+        
+        The returned auth data carries the user's JWT in "token". It is also kept
+        as the client's default token; callers sharing one client between users
+        pass it back explicitly as `jwt_token`.
+        """
         # Generate valid Telegram signature
         init_data = TelegramSignatureGenerator.create_telegram_init_data(
             telegram_user, bot_token
@@ -291,18 +398,16 @@ class VibeAPIClient:
         
         auth_data = response.json()
         self.jwt_token = auth_data["token"]
-        
         return auth_data
     
-    def create_profile(self, profile_id: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_profile(
+        self,
+        profile_id: str,
+        profile_data: Dict[str, Any],
+        jwt_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """Create a new profile"""
-        if not self.jwt_token:
-            raise Exception("Not authenticated. Call authenticate_user first.")
-        
-        headers = {
-            "Authorization": f"Bearer {self.jwt_token}",
-            "Content-Type": "application/json"
-        }
+        headers = self._auth_headers(jwt_token)
         
         payload = {"profile": profile_data}
         
@@ -318,25 +423,32 @@ class VibeAPIClient:
         
         return response.json()
     
-    def upload_profile_image(self, profile_id: str, image_data: bytes) -> Dict[str, Any]:
+    def get_profile(self, profile_id: str, jwt_token: Optional[str] = None):
+        """Fetch a profile (returns the raw response)"""
+        return self.session.get(
+            f"{self.base_url}/profile/{profile_id}",
+            headers=self._auth_headers(jwt_token),
+            timeout=30
+        )
+    
+    def upload_profile_image(
+        self, profile_id: str, image_data: bytes, jwt_token: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Upload profile image"""
-        if not self.jwt_token:
-            raise Exception("Not authenticated. Call authenticate_user first.")
+        headers = self._auth_headers(jwt_token)
         
-        headers = {
-            "Authorization": f"Bearer {self.jwt_token}",
-            "Content-Type": "application/json"
-        }
+        image_size = len(image_data)
+        # S3 ETag of a single-part SSE-S3 upload is the MD5 of the body
+        expected_etag = hashlib.md5(image_data).hexdigest()
         
         # Create metadata
-        metadata = ImageService.create_media_metadata(image_data)
-        media_blob = base64.b64encode(json.dumps(metadata).encode()).decode()
+        media_blob = ImageService.encode_media_blob(image_data)
         
         # Step 1: Request upload URL
         upload_request = {
             "mediaType": "image/jpeg",
             "mediaBlob": media_blob,
-            "mediaSize": len(image_data)
+            "mediaSize": image_size
         }
         
         print(f"  Requesting upload URL for profile {profile_id}...")
@@ -357,23 +469,37 @@ class VibeAPIClient:
         print(f"  Got media ID: {media_id}")
         
         # Step 2: Upload to S3 using presigned URL
-        print(f"  Uploading {len(image_data)} bytes to S3...")
-        upload_response = self.session.post(
-            upload_data["uploadUrl"],
-            data=upload_data["uploadHeaders"],
-            files={"file": ("image.jpg", image_data, "image/jpeg")},
-            timeout=60
-        )
-        
-        if upload_response.status_code not in [200, 204]:
-            print(f"  S3 upload response: {upload_response.status_code} - {upload_response.text}")
-            raise Exception(f"S3 upload failed: {upload_response.status_code}")
+        # Presigned POST: encode the form once (S3 requires the file field last)
+        form_fields = list(upload_data["uploadHeaders"].items())
+        form_fields.append(("file", ("image.jpg", image_data, "image/jpeg")))
+        body, content_type = encode_multipart_formdata(form_fields)
+        
+        for attempt in range(1, self.S3_UPLOAD_ATTEMPTS + 1):
+            print(f"  Uploading {image_size} bytes to S3...")
+            upload_response = self.session.post(
+                upload_data["uploadUrl"],
+                content=body,
+                headers={"Content-Type": content_type},
+                timeout=60,
+            )
+            
+            if upload_response.status_code not in [200, 204]:
+                print(f"  S3 upload response: {upload_response.status_code} - {upload_response.text}")
+                raise Exception(f"S3 upload failed: {upload_response.status_code}")
+            
+            # Verify the stored object before telling the backend it is complete
+            s3_etag = upload_response.headers.get("ETag", "").strip('"')
+            if not s3_etag or s3_etag == expected_etag:
+                break
+            print(f"  ETag mismatch (attempt {attempt}): expected {expected_etag}, got {s3_etag}")
+        else:
+            raise Exception("S3 upload failed: ETag does not match uploaded data")
         
         # Step 3: Complete upload
         completion_data = {
             "uploadSuccess": True,
-            "s3ETag": upload_response.headers.get("ETag", "").strip('"'),
-            "actualSize": len(image_data)
+            "s3ETag": s3_etag,
+            "actualSize": image_size
         }
         
         print(f"  Completing upload...")
@@ -392,13 +518,50 @@ class VibeAPIClient:
         return completion_response.json()
 
 
+@functools.lru_cache(maxsize=None)
+def get_shared_api_client(api_url: str) -> VibeAPIClient:
+    """API client shared by all mock users targeting the same API"""
+    return VibeAPIClient(api_url, pool_size=64)
+
+
 class MockUserCreator:
     """Main class for creating mock users"""
     
-    def __init__(self, api_url: str, bot_token: str, num_images: int = 3):
-        self.api_client = VibeAPIClient(api_url)
+    def __init__(
+        self,
+        api_url: str,
+        bot_token: str,
+        num_images: int = 3,
+        api_client: Optional[VibeAPIClient] = None,
+    ):
+        self.api_client = api_client or get_shared_api_client(api_url)
         self.bot_token = bot_token
         self.num_images = num_images
+
+    PROFILE_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8, 1.5)
+    PROFILE_POLL_TIMEOUT = 3.0  # seconds
+    
+    def _wait_for_profile(self, jwt_token: str, profile_id: str) -> bool:
+        """Poll the profile with backoff until it is readable or the deadline passes"""
+        deadline = time.monotonic() + self.PROFILE_POLL_TIMEOUT
+        test_response = None
+        try:
+            for delay in (0.0,) + self.PROFILE_POLL_DELAYS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(delay, remaining))
+                test_response = self.api_client.get_profile(profile_id, jwt_token=jwt_token)
+                if test_response.status_code == 200:
+                    print("✓ Profile access confirmed")
+                    return True
+        except Exception as e:
+            print(f"⚠ Profile access test failed: {e}")
+            return False
+        
+        print(f"⚠ Profile access issue: {test_response.status_code} - {test_response.text}")
+        print("  This may cause media upload failures")
+        return False
     
     def create_mock_user(self) -> Dict[str, Any]:
         """Create a complete mock user with profile and images"""
@@ -411,6 +574,7 @@ class MockUserCreator:
         # Step 2: Authenticate with backend
         print("Authenticating with backend...")
         auth_data = self.api_client.authenticate_user(telegram_user, self.bot_token)
+        jwt_token = auth_data["token"]
         user_id = auth_data["userId"]
         profile_ids = auth_data["profileIds"]
         
@@ -423,53 +587,41 @@ class MockUserCreator:
         # Step 3: Create profile
         print("Creating profile...")
         profile_data = MockDataGenerator.generate_profile_data()
-        profile_response = self.api_client.create_profile(profile_id, profile_data)
+        profile_response = self.api_client.create_profile(
+            profile_id, profile_data, jwt_token=jwt_token
+        )
         print(f"Created profile: {profile_data['nickName']}")
         
-        # Brief delay for DynamoDB consistency
-        import time
-        time.sleep(2)
-        
-        # Step 3.5: Test profile access first
+        # Step 3.5: Wait until the profile is readable (DynamoDB consistency)
         print("Testing profile access...")
-        try:
-            test_response = self.api_client.session.get(
-                f"{self.api_client.base_url}/profile/{profile_id}",
-                headers={
-                    "Authorization": f"Bearer {self.api_client.jwt_token}",
-                    "Content-Type": "application/json"
-                },
-                timeout=30
-            )
-            if test_response.status_code == 200:
-                print("✓ Profile access confirmed")
-            else:
-                print(f"⚠ Profile access issue: {test_response.status_code} - {test_response.text}")
-                print("  This may cause media upload failures")
-        except Exception as e:
-            print(f"⚠ Profile access test failed: {e}")
+        self._wait_for_profile(jwt_token, profile_id)
 
-        # Step 4: Upload profile images
+        # Step 4: Upload profile images. Downloads run concurrently; uploads run one at
+        # a time in image order, because the backend hands out the first non-active
+        # media slot and only marks it active on completion.
         uploaded_images = []
-        for i in range(self.num_images):
-            try:
-                print(f"Uploading image {i+1}/{self.num_images}...")
-                image_data = ImageService.download_random_image(
-                    telegram_user["id"] + i
-                )
-                
-                if image_data:  # Only upload if we have image data
-                    upload_response = self.api_client.upload_profile_image(
-                        profile_id, image_data
+        if self.num_images > 0:
+            print(f"Uploading {self.num_images} images...")
+            with ThreadPoolExecutor(max_workers=self.num_images) as executor:
+                downloads = [
+                    executor.submit(
+                        ImageService.download_random_image, telegram_user["id"] + i
                     )
-                    uploaded_images.append(upload_response)
-                    print(f"Uploaded image {i+1}: {upload_response['mediaId']}")
-                else:
-                    print(f"Skipping image {i+1} (no data)")
-                    
-            except Exception as e:
-                print(f"Failed to upload image {i+1}: {e}")
-                continue
+                    for i in range(self.num_images)
+                ]
+                for i, download in enumerate(downloads):
+                    try:
+                        image_data = download.result()
+                        if image_data:
+                            upload_response = self.api_client.upload_profile_image(
+                                profile_id, image_data, jwt_token=jwt_token
+                            )
+                            uploaded_images.append(upload_response)
+                            print(f"Uploaded image {i+1}: {upload_response['mediaId']}")
+                        else:
+                            print(f"Skipping image {i+1} (no data)")
+                    except Exception as e:
+                        print(f"Failed to upload image {i+1}: {e}")
         
         return {
             "telegram_user": telegram_user,
@@ -482,21 +634,61 @@ class MockUserCreator:
         }
 
 
-def get_bot_token_from_aws(environment: str) -> str:
-    """Get bot token from AWS Secrets Manager"""
+BOT_TOKEN_CACHE_DIR = Path.home() / ".cache" / "vibe-dating"
+BOT_TOKEN_CACHE_TTL = 3600  # seconds
+
+
+def _read_cached_bot_token(cache_file: Path) -> Optional[str]:
+    """Return the on-disk cached bot token if it is still fresh"""
+    try:
+        if time.time() - cache_file.stat().st_mtime < BOT_TOKEN_CACHE_TTL:
+            return cache_file.read_text().strip() or None
+    except OSError:
+        pass
+    return None
+
+
+def _write_cached_bot_token(cache_file: Path, bot_token: str) -> None:
+    """Cache the bot token on disk, readable only by the current user"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(bot_token)
+    except OSError as e:
+        print(f"Warning: could not cache bot token: {e}")
+
+
+@functools.cache
+def _aws_session(environment: str):
+    """Create the boto3 session for an environment once per process"""
     import boto3
+    
+    return boto3.Session(profile_name=f"vibe-{environment}")
+
+
+@functools.lru_cache(maxsize=4)
+def get_bot_token_from_aws(environment: str) -> str:
+    """Get bot token from AWS Secrets Manager (cached in-process and on disk)"""
+    cache_file = BOT_TOKEN_CACHE_DIR / f"bot-token-{environment}"
+    cached_token = _read_cached_bot_token(cache_file)
+    if cached_token:
+        return cached_token
+    
     from botocore.exceptions import ClientError
     
     try:
-        session = boto3.Session(profile_name=f"vibe-{environment}")
-        secrets_client = session.client("secretsmanager")
+        secrets_client = _aws_session(environment).client("secretsmanager")
         
         secret_name = f"vibe-dating/telegram-bot-token/{environment}"
         response = secrets_client.get_secret_value(SecretId=secret_name)
-        return response["SecretString"]
+        bot_token = response["SecretString"]
         
     except ClientError as e:
         raise Exception(f"Failed to get bot token from AWS: {e}")
+    
+    _write_cached_bot_token(cache_file, bot_token)
+    return bot_token
 
 
 def main():
@@ -12,17 +12,173 @@ import sys
 import argparse
 import json
 import csv
+import functools
+import queue
 import random
 import string
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
 import boto3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Generator
-from datetime import datetime
+from typing import Dict, Any, Callable, List, Optional, Generator
+from datetime import date, datetime
+from decimal import Decimal
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set AWS profile
 os.environ["AWS_PROFILE"] = "vibe-dev"
 
+# Number of parallel scan segments (each gets its own worker thread)
+DEFAULT_SCAN_SEGMENTS = 16
+# Headroom over one connection per segment so paginator retries and other calls never queue
+MAX_POOL_CONNECTIONS = 64
+
+# Shared by the client and resource: large pool, adaptive client-side rate limiting
+# for throttled parallel scans/deletes, and TCP keepalive for long-running dumps
+_BOTO_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+# Raw pages each segment worker may fetch ahead of the consumer
+SCAN_PREFETCH_PAGES = 2
+
+# DynamoDB BatchGetItem accepts at most 100 keys per request
+BATCH_GET_SIZE = 100
+BATCH_GET_MAX_RETRIES = 8
+# DynamoDB BatchWriteItem accepts at most 25 requests per call
+BATCH_WRITE_SIZE = 25
+BATCH_WRITE_MAX_RETRIES = 8
+
+# Upper bound on cached CSV column lists for nested maps; further shapes are built per row
+CSV_COLUMN_CACHE_SIZE = 1024
+
+
+class FastDeserializer(TypeDeserializer):
+    """TypeDeserializer that returns int instead of Decimal for integral N values
+
+    Every scan, query and key read goes through it. Integers (counts, ages,
+    timestamps) are exact as int and skip the Decimal parser; anything else is
+    still a Decimal, so fractional values keep full precision.
+    """
+
+    def _deserialize_n(self, value):
+        if value.lstrip('-').isdigit():
+            return int(value)
+        return super()._deserialize_n(value)
+
+
+_DESERIALIZER = FastDeserializer()
+
+
+def _deserialize_item(raw_item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a low-level client item ({'S': ...} attribute values) to plain Python values"""
+    return {k: _DESERIALIZER.deserialize(v) for k, v in raw_item.items()}
+
+
+# Attributes dump_as_tree reads; everything else stays on the server
+TREE_ATTRIBUTES = [
+    'PK', 'SK', 'GSI1PK', 'platform', 'platformMetadata', 'createdAt', 'status',
+    'nickName', 'age', 'location', 'sexualPosition', 'mediaType', 's3Key'
+]
+_SEGMENT_DONE = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _client(service: str, region: str):
+    """One boto3 client per (service, region) for the whole run"""
+    return boto3.client(service, region_name=region, config=_BOTO_CONFIG)
+
+
+@functools.lru_cache(maxsize=None)
+def _resource(service: str, region: str):
+    """One boto3 resource per (service, region) for the whole run"""
+    return boto3.resource(service, region_name=region, config=_BOTO_CONFIG)
+
+
+def _default(obj: Any) -> Any:
+    """JSON fallback for types DynamoDB and boto3 hand back"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    _ORJSON_INDENT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_INDENT_OPTIONS)
+    return json.dumps(obj, indent=2, default=_default, ensure_ascii=False).encode('utf-8')
+
+
+def _print_json(obj: Any):
+    """Write indented JSON straight to stdout's byte buffer, skipping text re-encoding"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_dumps_bytes(obj))
+    sys.stdout.buffer.write(b'\n')
+    sys.stdout.buffer.flush()
+
+
+def _dump_item(item: Dict[str, Any]) -> bytes:
+    """Serialize one item as compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(item, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(item, default=_default, ensure_ascii=False).encode('utf-8')
+
+
+def _flatten_generic(item: Dict[str, Any],
+                     column_cache: Optional[Dict[tuple, List[str]]] = None) -> Dict[str, str]:
+    """Flatten nested structures for CSV
+
+    column_cache maps (key, nested map keys) to the flattened column names, so
+    rows sharing a nested layout reuse one list instead of formatting each name.
+    """
+    if column_cache is None:
+        column_cache = {}
+    flattened = {}
+    for key, value in item.items():
+        if isinstance(value, dict):
+            header = (key, tuple(value))
+            columns = column_cache.get(header)
+            if columns is None:
+                columns = [f"{key}_{sub_key}" for sub_key in value]
+                if len(column_cache) < CSV_COLUMN_CACHE_SIZE:
+                    column_cache[header] = columns
+            flattened.update(zip(columns, map(str, value.values())))
+        elif isinstance(value, list):
+            flattened[key] = ", ".join(str(v) for v in value)
+        else:
+            flattened[key] = str(value)
+    return flattened
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(obj: Any, path: Path):
+    """Write indented JSON to path"""
+    with open(path, 'wb') as f:
+        f.write(_dumps_bytes(obj))
+
 
 class DynamoDBDumper:
     """Dumps DynamoDB table data for Vibe Dating App"""
@@ -31,8 +187,6 @@ class DynamoDBDumper:
         self.project_root = Path(__file__).parent.parent
         self.region = os.getenv("AWS_REGION", "il-central-1")
         self.environment = os.getenv("ENVIRONMENT", "dev")
-        self.dynamodb = boto3.resource('dynamodb', region_name=self.region)
-        self.dynamodb_client = boto3.client('dynamodb', region_name=self.region)
 
         # Table name based on environment
         self.table_name = f"vibe-dating-{self.environment}"
@@ -45,16 +199,35 @@ class DynamoDBDumper:
             "location": "LOCATION"
         }
 
+        # PK prefixes ("USER#") per entity type
+        self._prefix_for = {name: f"{prefix}#" for name, prefix in self.entity_types.items()}
+
+        # Scan filters per entity type, built once in the low-level client's wire format
+        self._filter_by_entity = {
+            name: self._build_entity_filter(pk_prefix) for name, pk_prefix in self._prefix_for.items()
+        }
+
+        self._table = None
+        self._csv_column_cache: Dict[tuple, List[str]] = {}
+
+    @property
+    def dynamodb(self):
+        return _resource('dynamodb', self.region)
+
+    @property
+    def dynamodb_client(self):
+        return _client('dynamodb', self.region)
+
+    @property
+    def table(self):
+        """Table resource, bound once per run"""
+        if self._table is None:
+            self._table = self.dynamodb.Table(self.table_name)
+        return self._table
+
     def check_prerequisites(self):
         """Check that all prerequisites are met"""
 
-        # Check if boto3 is installed
-        try:
-            import boto3
-        except ImportError:
-            print("❌ boto3 is not installed. Please install it first.")
-            sys.exit(1)
-
         # Check AWS credentials
         try:
             self.dynamodb_client.list_tables()
@@ -65,10 +238,9 @@ class DynamoDBDumper:
             print(f"❌ AWS credentials error: {e}")
             sys.exit(1)
 
-        # Check if table exists
+        # Check if table exists; the description is kept for later lookups
         try:
-            table = self.dynamodb.Table(self.table_name)
-            table.load()
+            self.table_description
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
                 print(f"❌ DynamoDB table '{self.table_name}' not found")
@@ -80,18 +252,17 @@ class DynamoDBDumper:
     def get_table_info(self) -> Dict[str, Any]:
         """Get table information and statistics"""
         try:
-            table = self.dynamodb.Table(self.table_name)
-            response = self.dynamodb_client.describe_table(TableName=self.table_name)
+            table_info = self.table_description
 
             # Get table statistics
             stats = {
                 "table_name": self.table_name,
-                "item_count": response['Table'].get('ItemCount', 0),
-                "table_size_bytes": response['Table'].get('TableSizeBytes', 0),
-                "billing_mode": response['Table'].get('BillingModeSummary', {}).get('BillingMode', 'UNKNOWN'),
-                "creation_date": response['Table'].get('CreationDateTime', '').isoformat() if response['Table'].get('CreationDateTime') else None,
-                "status": response['Table'].get('TableStatus', 'UNKNOWN'),
-                "gsis": len(response['Table'].get('GlobalSecondaryIndexes', [])),
+                "item_count": table_info.get('ItemCount', 0),
+                "table_size_bytes": table_info.get('TableSizeBytes', 0),
+                "billing_mode": table_info.get('BillingModeSummary', {}).get('BillingMode', 'UNKNOWN'),
+                "creation_date": self._creation_date(),
+                "status": table_info.get('TableStatus', 'UNKNOWN'),
+                "gsis": len(table_info.get('GlobalSecondaryIndexes', [])),
                 "region": self.region,
                 "environment": self.environment
             }
@@ -101,146 +272,377 @@ class DynamoDBDumper:
             print(f"❌ Failed to get table info: {e}")
             return {}
 
-    def scan_table(self, entity_type: Optional[str] = None, limit: Optional[int] = None) -> Generator[Dict[str, Any], None, None]:
-        """Scan the DynamoDB table with optional filtering"""
-        try:
-            table = self.dynamodb.Table(self.table_name)
+    @functools.cached_property
+    def table_description(self) -> Dict[str, Any]:
+        """DescribeTable result, fetched once per run"""
+        return self.dynamodb_client.describe_table(TableName=self.table_name)['Table']
+
+    def _creation_date(self) -> Optional[str]:
+        """Table creation time as ISO 8601, if DescribeTable reported one"""
+        created = self.table_description.get('CreationDateTime')
+        return created.isoformat() if created else None
+
+    def _pk_prefix(self, entity_type: str) -> str:
+        """PK prefix including the '#' separator, e.g. 'USER#'"""
+        pk_prefix = self._prefix_for.get(entity_type.lower())
+        if pk_prefix is None:
+            pk_prefix = f"{entity_type.upper()}#"
+        return pk_prefix
+
+    @staticmethod
+    def _build_entity_filter(pk_prefix: str) -> Dict[str, Any]:
+        return {
+            'FilterExpression': 'begins_with(#pk, :p)',
+            'ExpressionAttributeNames': {'#pk': 'PK'},
+            'ExpressionAttributeValues': {':p': {'S': pk_prefix}}
+        }
 
-            # Build scan parameters
-            scan_kwargs = {}
+    def _entity_filter(self, entity_type: str) -> Dict[str, Any]:
+        """Scan kwargs selecting one entity type by PK prefix"""
+        entity_filter = self._filter_by_entity.get(entity_type.lower())
+        if entity_filter is None:
+            entity_filter = self._build_entity_filter(self._pk_prefix(entity_type))
+        return entity_filter
+
+    def count_entity(self, entity_type: Optional[str] = None) -> int:
+        """Count items of an entity type (or the whole table) without transferring item payloads"""
+        if entity_type is None:
+            count_kwargs = {}
+            operation = self.dynamodb_client.scan
+        else:
+            # Same PK-prefix selection as scans and truncate, so counts match what they touch
+            count_kwargs = dict(self._entity_filter(entity_type))
+            operation = self.dynamodb_client.scan
+
+        count_kwargs.update(TableName=self.table_name, Select='COUNT')
+        count = 0
+        while True:
+            response = operation(**count_kwargs)
+            count += response['Count']
+
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if not last_evaluated_key:
+                return count
+            count_kwargs['ExclusiveStartKey'] = last_evaluated_key
+
+    def count_by_entity_prefix(self) -> Counter:
+        """Tally items per PK prefix (USER, PROFILE, ...) in a single keys-only scan"""
+        paginator = self.dynamodb_client.get_paginator('scan')
+        counts = Counter()
+        for page in paginator.paginate(
+            TableName=self.table_name,
+            ProjectionExpression='#pk',
+            ExpressionAttributeNames={'#pk': 'PK'}
+        ):
+            counts.update(item['PK']['S'].partition('#')[0] for item in page.get('Items', []))
+        return counts
+
+    def _queue_put(self, out_queue: queue.Queue, value: Any, stop_event: threading.Event) -> bool:
+        """Put onto the scan queue unless the consumer has stopped reading"""
+        while not stop_event.is_set():
+            try:
+                out_queue.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _scan_segment(self, client, scan_kwargs: Dict[str, Any], pagination_config: Dict[str, Any],
+                      segment: int, total_segments: int, out_queue: queue.Queue, stop_event: threading.Event):
+        """Scan one table segment with the low-level client, pushing raw item pages onto out_queue
+
+        Pages are handed over undeserialized so the worker can request the next page
+        right away instead of spending the round trip converting items.
+        """
+        paginator = client.get_paginator('scan')
+        try:
+            for page in paginator.paginate(TableName=self.table_name, Segment=segment, TotalSegments=total_segments,
+                                           PaginationConfig=pagination_config, **scan_kwargs):
+                raw_items = page.get('Items')
+                if raw_items and not self._queue_put(out_queue, raw_items, stop_event):
+                    return
+                if stop_event.is_set():
+                    return
+        except Exception as e:
+            self._queue_put(out_queue, e, stop_event)
+        finally:
+            self._queue_put(out_queue, _SEGMENT_DONE, stop_event)
 
-            if entity_type:
-                # Filter by entity type using PK starts with
-                entity_prefix = self.entity_types.get(entity_type.lower(), entity_type.upper())
-                scan_kwargs['FilterExpression'] = boto3.dynamodb.conditions.Attr('PK').begins_with(f"{entity_prefix}#")
+    def scan_table(self, entity_type: Optional[str] = None, limit: Optional[int] = None,
+                   parallel_segments: int = DEFAULT_SCAN_SEGMENTS,
+                   projection: Optional[List[str]] = None) -> Generator[Dict[str, Any], None, None]:
+        """Scan the DynamoDB table with optional filtering, yielding deserialized items
 
-            if limit:
-                scan_kwargs['Limit'] = limit
+        See scan_table_raw for how the table is read.
+        """
+        raw_items = self.scan_table_raw(entity_type, limit, parallel_segments, projection)
+        try:
+            for raw_item in raw_items:
+                yield _deserialize_item(raw_item)
+        finally:
+            # Stops the segment workers as soon as the consumer stops early
+            raw_items.close()
+
+    def scan_table_raw(self, entity_type: Optional[str] = None, limit: Optional[int] = None,
+                       parallel_segments: int = DEFAULT_SCAN_SEGMENTS,
+                       projection: Optional[List[str]] = None) -> Generator[Dict[str, Any], None, None]:
+        """Scan the DynamoDB table with optional filtering, yielding items in DynamoDB JSON
+
+        The table is read as `parallel_segments` concurrent segment scans; items are
+        yielded in arrival order as soon as any segment returns them. `projection`
+        limits the attributes DynamoDB sends back.
+        """
+        # Build scan parameters
+        scan_kwargs = {}
+
+        if entity_type:
+            # Filter by entity type using PK starts with
+            scan_kwargs.update(self._entity_filter(entity_type))
+
+        if projection:
+            # Placeholders keep reserved words like `status` and `location` valid
+            names = dict(scan_kwargs.get('ExpressionAttributeNames', {}))
+            placeholders = []
+            for i, attribute in enumerate(projection):
+                names[f'#a{i}'] = attribute
+                placeholders.append(f'#a{i}')
+            scan_kwargs['ProjectionExpression'] = ', '.join(placeholders)
+            scan_kwargs['ExpressionAttributeNames'] = names
+
+        # Unlimited pages already fill DynamoDB's 1MB budget; only a small unfiltered
+        # --limit benefits from smaller pages, since every page item is then kept
+        pagination_config = {}
+        if limit and not entity_type:
+            pagination_config['PageSize'] = limit
+
+        # Fetched here so segment workers share one client instead of racing to build it
+        client = self.dynamodb_client
+        out_queue: queue.Queue = queue.Queue(maxsize=parallel_segments * SCAN_PREFETCH_PAGES)
+        stop_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=parallel_segments)
+        try:
+            for segment in range(parallel_segments):
+                executor.submit(self._scan_segment, client, scan_kwargs, pagination_config, segment, parallel_segments, out_queue, stop_event)
 
-            # Scan with pagination
-            last_evaluated_key = None
             items_scanned = 0
+            segments_done = 0
+            while segments_done < parallel_segments:
+                value = out_queue.get()
+                if value is _SEGMENT_DONE:
+                    segments_done += 1
+                    continue
+                if isinstance(value, ClientError):
+                    print(f"❌ Failed to scan table: {value}")
+                    return
+                if isinstance(value, Exception):
+                    raise value
 
-            while True:
-                if last_evaluated_key:
-                    scan_kwargs['ExclusiveStartKey'] = last_evaluated_key
-
-                response = table.scan(**scan_kwargs)
-
-                for item in response.get('Items', []):
+                for raw_item in value:
                     items_scanned += 1
-                    yield item
+                    yield raw_item
 
                     if limit and items_scanned >= limit:
                         return
-
-                last_evaluated_key = response.get('LastEvaluatedKey')
-                if not last_evaluated_key:
-                    break
-
-        except ClientError as e:
-            print(f"❌ Failed to scan table: {e}")
-            return
+        finally:
+            # Also runs when the consumer stops early; lets blocked segment workers exit
+            stop_event.set()
+            executor.shutdown(wait=True)
 
     def query_by_entity(self, entity_type: str, entity_id: str) -> List[Dict[str, Any]]:
         """Query specific entity by ID"""
         try:
-            table = self.dynamodb.Table(self.table_name)
-            entity_prefix = self.entity_types.get(entity_type.lower(), entity_type.upper())
-
-            response = table.query(
-                KeyConditionExpression='PK = :pk',
-                ExpressionAttributeValues={
-                    ':pk': f"{entity_prefix}#{entity_id}"
+            table = self.table
+            query_kwargs = {
+                'KeyConditionExpression': 'PK = :pk',
+                'ExpressionAttributeValues': {
+                    ':pk': self._pk_prefix(entity_type) + entity_id
                 }
-            )
+            }
+
+            items = []
+            while True:
+                response = table.query(**query_kwargs)
+                items.extend(response.get('Items', []))
 
-            return response.get('Items', [])
+                last_evaluated_key = response.get('LastEvaluatedKey')
+                if not last_evaluated_key:
+                    return items
+                query_kwargs['ExclusiveStartKey'] = last_evaluated_key
 
         except ClientError as e:
             print(f"❌ Failed to query entity: {e}")
             return []
 
+    def query_by_entities(self, entity_type: str, entity_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch the METADATA item of several entities with BatchGetItem"""
+        pk_prefix = self._pk_prefix(entity_type)
+        keys = [
+            {'PK': {'S': pk_prefix + entity_id}, 'SK': {'S': 'METADATA'}}
+            for entity_id in dict.fromkeys(entity_ids)
+        ]
+
+        items = []
+        try:
+            for start in range(0, len(keys), BATCH_GET_SIZE):
+                request_items = {self.table_name: {'Keys': keys[start:start + BATCH_GET_SIZE]}}
+                for attempt in range(BATCH_GET_MAX_RETRIES):
+                    response = self.dynamodb_client.batch_get_item(RequestItems=request_items)
+                    for raw_item in response.get('Responses', {}).get(self.table_name, []):
+                        items.append(_deserialize_item(raw_item))
+
+                    request_items = response.get('UnprocessedKeys')
+                    if not request_items:
+                        break
+                    time.sleep(min(0.05 * (2 ** attempt), 2.0))
+                else:
+                    unprocessed = len(request_items[self.table_name]['Keys'])
+                    print(f"⚠️  {unprocessed} {entity_type} keys were still unprocessed after {BATCH_GET_MAX_RETRIES} attempts")
+        except ClientError as e:
+            print(f"❌ Failed to batch get entities: {e}")
+
+        return items
+
     def format_item_for_output(self, item: Dict[str, Any], format_type: str = "json") -> Dict[str, Any]:
         """Format item for different output formats"""
         if format_type == "json":
             return item
         elif format_type == "csv":
-            # Flatten nested structures for CSV
-            flattened = {}
-            for key, value in item.items():
-                if isinstance(value, dict):
-                    for sub_key, sub_value in value.items():
-                        flattened[f"{key}_{sub_key}"] = str(sub_value)
-                elif isinstance(value, list):
-                    flattened[key] = ", ".join(str(v) for v in value)
-                else:
-                    flattened[key] = str(value)
-            return flattened
+            return _flatten_generic(item, self._csv_column_cache)
         else:
             return item
 
     def save_to_file(self, data: List[Dict[str, Any]], output_file: str, format_type: str = "json"):
         """Save data to file in specified format"""
+        self.save_stream_to_file(data, output_file, format_type)
+
+    def _write_json_stream(self, items_iter, f) -> int:
+        """Write items as a JSON array to a binary file, one item per line"""
+        count = 0
+        f.write(b'[')
+        for item in items_iter:
+            f.write(b'\n' if count == 0 else b',\n')
+            f.write(_dump_item(item))
+            count += 1
+        f.write(b'\n]\n' if count else b']\n')
+        return count
+
+    def _write_csv_rows(self, rows, f, fieldnames: List[str]) -> int:
+        """Write already flattened rows under a fixed header"""
+        known_fields = set(fieldnames)
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+
+        count = 0
+        truncated_rows = 0
+        for row in rows:
+            if not known_fields.issuperset(row):
+                truncated_rows += 1
+            writer.writerow(row)
+            count += 1
+
+        if truncated_rows:
+            print(f"⚠️  {truncated_rows} rows had columns outside --csv-fields and were truncated")
+        return count
+
+    def _write_csv_stream(self, items_iter, f, csv_fields: Optional[List[str]] = None) -> int:
+        """Write flattened items as CSV; columns come from csv_fields or from every row"""
+        if isinstance(items_iter, list):
+            # Items already in memory: flatten each once and take the header from those rows
+            rows = [self.format_item_for_output(item, "csv") for item in items_iter]
+            all_fields = csv_fields or sorted(set().union(*rows))
+            if not all_fields:
+                print("⚠️  No data to save")
+                return 0
+            return self._write_csv_rows(rows, f, list(all_fields))
+
+        rows = (self.format_item_for_output(item, "csv") for item in items_iter)
+        if csv_fields:
+            return self._write_csv_rows(rows, f, list(csv_fields))
+
+        # Spool rows to a temporary NDJSON file while collecting columns, so the
+        # header covers every row without holding the dump in memory
+        all_fields = set()
+        with tempfile.TemporaryFile() as spool:
+            for row in rows:
+                all_fields.update(row)
+                spool.write(_dump_item(row))
+                spool.write(b'\n')
+
+            if not all_fields:
+                print("⚠️  No data to save")
+                return 0
+
+            spool.seek(0)
+            return self._write_csv_rows((_loads(line) for line in spool), f, sorted(all_fields))
+
+    def save_stream_to_file(self, items_iter, output_file: str, format_type: str = "json",
+                            csv_fields: Optional[List[str]] = None) -> int:
+        """Stream items (an iterator or a list) to file in specified format, returning the number written"""
         try:
             output_path = Path(output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
+            count = 0
             if format_type == "json":
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, default=str)
+                with open(output_path, 'wb') as f:
+                    count = self._write_json_stream(items_iter, f)
 
             elif format_type == "csv":
-                if not data:
-                    print("⚠️  No data to save")
-                    return
-
-                # Get all possible fields from all items
-                all_fields = set()
-                for item in data:
-                    flattened = self.format_item_for_output(item, "csv")
-                    all_fields.update(flattened.keys())
-
                 with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=sorted(all_fields))
-                    writer.writeheader()
-
-                    for item in data:
-                        flattened = self.format_item_for_output(item, "csv")
-                        writer.writerow(flattened)
+                    count = self._write_csv_stream(items_iter, f, csv_fields)
+                if not count:
+                    return 0
 
             print(f"✅ Data saved to {output_path}")
+            return count
 
         except Exception as e:
             print(f"❌ Failed to save data: {e}")
+            return 0
+
+    def _with_progress(self, items_iter, mask: int, label: str):
+        """Pass items through, printing a progress line every `mask + 1` items (a power of two)"""
+        count = 0
+        for item in items_iter:
+            count += 1
+            if not count & mask:
+                print(f"• Scanned {count} {label}...")
+            yield item
+
+    def _stream_output(self, items_iter, output_file: str, format_type: str, label: str,
+                       progress_mask: int, csv_fields: Optional[List[str]] = None) -> int:
+        """Send scanned items to a file or stdout without collecting them first"""
+        if output_file:
+            return self.save_stream_to_file(self._with_progress(items_iter, progress_mask, label),
+                                            output_file, format_type, csv_fields)
 
-    def dump_entire_table(self, output_file: str, format_type: str = "json", limit: Optional[int] = None):
+        if format_type == "json":
+            # Progress lines would end up inside the JSON array, so stdout dumps stay quiet
+            sys.stdout.flush()
+            count = self._write_json_stream(items_iter, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+            return count
+
+        # For CSV, print first few items as preview
+        print(f"Preview of first 5 {label}:")
+        count = 0
+        for count, item in enumerate(self._with_progress(items_iter, progress_mask, label), 1):
+            if count <= 5:
+                print(f"Item {count}: {self.format_item_for_output(item, format_type)}")
+        return count
+
+    def dump_entire_table(self, output_file: str, format_type: str = "json", limit: Optional[int] = None,
+                          csv_fields: Optional[List[str]] = None):
         """Dump entire table"""
         print(f"📊 Dumping entire table '{self.table_name}'...")
 
-        items = []
-        for item in self.scan_table(limit=limit):
-            formatted_item = self.format_item_for_output(item, format_type)
-            items.append(formatted_item)
-
-            if len(items) % 100 == 0:
-                print(f"• Scanned {len(items)} items...")
+        count = self._stream_output(self.scan_table(limit=limit), output_file, format_type,
+                                    "items", 1023, csv_fields)
 
-        print(f"✅ Scanned {len(items)} items total")
+        print(f"✅ Scanned {count} items total")
 
-        if output_file:
-            self.save_to_file(items, output_file, format_type)
-        else:
-            # Print to stdout
-            if format_type == "json":
-                print(json.dumps(items, indent=2, default=str))
-            else:
-                # For CSV, print first few items as preview
-                print(f"Preview of first 5 items:")
-                for i, item in enumerate(items[:5]):
-                    print(f"Item {i+1}: {item}")
-
-    def dump_entity_type(self, entity_type: str, output_file: str, format_type: str = "json", limit: Optional[int] = None):
+    def dump_entity_type(self, entity_type: str, output_file: str, format_type: str = "json", limit: Optional[int] = None,
+                         csv_fields: Optional[List[str]] = None):
         """Dump specific entity type"""
         if entity_type.lower() not in self.entity_types:
             print(f"❌ Unknown entity type: {entity_type}")
@@ -249,27 +651,11 @@ class DynamoDBDumper:
 
         print(f"📊 Dumping {entity_type} entities from table '{self.table_name}'...")
 
-        items = []
-        for item in self.scan_table(entity_type=entity_type, limit=limit):
-            formatted_item = self.format_item_for_output(item, format_type)
-            items.append(formatted_item)
-
-            if len(items) % 50 == 0:
-                print(f"• Scanned {len(items)} {entity_type} items...")
+        source = self.scan_table(entity_type=entity_type, limit=limit)
+        count = self._stream_output(source, output_file, format_type,
+                                    f"{entity_type} items", 511, csv_fields)
 
-        print(f"✅ Scanned {len(items)} {entity_type} items total")
-
-        if output_file:
-            self.save_to_file(items, output_file, format_type)
-        else:
-            # Print to stdout
-            if format_type == "json":
-                print(json.dumps(items, indent=2, default=str))
-            else:
-                # For CSV, print first few items as preview
-                print(f"Preview of first 5 {entity_type} items:")
-                for i, item in enumerate(items[:5]):
-                    print(f"Item {i+1}: {item}")
+        print(f"✅ Scanned {count} {entity_type} items total")
 
     def dump_specific_entity(self, entity_type: str, entity_id: str, output_file: str, format_type: str = "json"):
         """Dump specific entity by ID"""
@@ -298,7 +684,7 @@ class DynamoDBDumper:
         else:
             # Print to stdout
             if format_type == "json":
-                print(json.dumps(formatted_items, indent=2, default=str))
+                _print_json(formatted_items)
             else:
                 # For CSV, print items as preview
                 print(f"Preview of {entity_type} items:")
@@ -310,11 +696,15 @@ class DynamoDBDumper:
         print(f"📊 Entity counts for table '{self.table_name}':")
         print("-" * 50)
 
+        try:
+            counts = self.count_by_entity_prefix()
+        except ClientError as e:
+            print(f"❌ Failed to count entities: {e}")
+            return
+
         total_items = 0
         for entity_name, entity_prefix in self.entity_types.items():
-            count = 0
-            for _ in self.scan_table(entity_type=entity_name):
-                count += 1
+            count = counts[entity_prefix]
             print(f"{entity_name.capitalize():<12}: {count:>6} items")
             total_items += count
 
@@ -324,8 +714,7 @@ class DynamoDBDumper:
     def export_table_schema(self, output_file: str = None):
         """Export table schema information"""
         try:
-            response = self.dynamodb_client.describe_table(TableName=self.table_name)
-            table_info = response['Table']
+            table_info = self.table_description
 
             schema = {
                 "table_name": self.table_name,
@@ -336,7 +725,7 @@ class DynamoDBDumper:
                     "billing_mode": table_info.get('BillingModeSummary', {}).get('BillingMode'),
                     "item_count": table_info.get('ItemCount'),
                     "table_size_bytes": table_info.get('TableSizeBytes'),
-                    "creation_date": table_info.get('CreationDateTime', '').isoformat() if table_info.get('CreationDateTime') else None,
+                    "creation_date": self._creation_date(),
                     "status": table_info.get('TableStatus'),
                     "point_in_time_recovery": table_info.get('PointInTimeRecoveryDescription', {}).get('PointInTimeRecoveryStatus')
                 },
@@ -348,33 +737,63 @@ class DynamoDBDumper:
             }
 
             if output_file:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(schema, f, indent=2, default=str)
+                _write_json(schema, Path(output_file))
                 print(f"✅ Schema exported to {output_file}")
             else:
-                print(json.dumps(schema, indent=2, default=str))
+                _print_json(schema)
 
         except ClientError as e:
             print(f"❌ Failed to export schema: {e}")
 
     def debug_console(self):
         """Console log table data"""
-        table = self.dynamodb.Table(self.table_name)
+        table = self.table
         from IPython import embed; embed(banner1="\nAccess dynamodb table using 'table' variable\n")
 
-    def truncate_table(self, entity_type: Optional[str] = None, force: bool = False):
+    def _delete_keys(self, client, keys: List[Dict[str, Any]]) -> int:
+        """Delete up to BATCH_WRITE_SIZE keys with BatchWriteItem, retrying unprocessed ones"""
+        request_items = {self.table_name: [{'DeleteRequest': {'Key': key}} for key in keys]}
+        for attempt in range(BATCH_WRITE_MAX_RETRIES):
+            response = client.batch_write_item(RequestItems=request_items)
+            request_items = response.get('UnprocessedItems')
+            if not request_items:
+                return len(keys)
+            time.sleep(min(0.05 * (2 ** attempt), 2.0))
+        raise RuntimeError(f"{len(request_items[self.table_name])} deletes still unprocessed "
+                           f"after {BATCH_WRITE_MAX_RETRIES} attempts")
+
+    def _truncate_segment(self, client, scan_kwargs: Dict[str, Any], segment: int, total_segments: int,
+                          on_deleted: Callable[[int], None], stop_event: threading.Event) -> int:
+        """Delete every item of one scan segment, returning how many were deleted"""
+        paginator = client.get_paginator('scan')
+        deleted = 0
+        keys = []
+        for page in paginator.paginate(TableName=self.table_name, Segment=segment,
+                                       TotalSegments=total_segments, **scan_kwargs):
+            # Items carry only PK and SK, already in the wire format BatchWriteItem takes
+            for key in page.get('Items', []):
+                keys.append(key)
+                if len(keys) == BATCH_WRITE_SIZE:
+                    deleted += self._delete_keys(client, keys)
+                    on_deleted(len(keys))
+                    keys = []
+            if stop_event.is_set():
+                break
+
+        if keys and not stop_event.is_set():
+            deleted += self._delete_keys(client, keys)
+            on_deleted(len(keys))
+        return deleted
+
+    def truncate_table(self, entity_type: Optional[str] = None, force: bool = False,
+                       parallel_segments: int = DEFAULT_SCAN_SEGMENTS):
         """Truncate (delete all items) from the table"""
+        entity_desc = f"{entity_type} entities" if entity_type else "all entities"
+        stop_event = threading.Event()
         try:
-            table = self.dynamodb.Table(self.table_name)
-
             if not force:
                 # Get item count for confirmation
-                if entity_type:
-                    count = sum(1 for _ in self.scan_table(entity_type=entity_type))
-                    entity_desc = f"{entity_type} entities"
-                else:
-                    count = sum(1 for _ in self.scan_table())
-                    entity_desc = "all entities"
+                count = self.count_entity(entity_type)
 
                 print(f"⚠️  WARNING: This will delete {count} {entity_desc} from table '{self.table_name}'")
                 print("This action cannot be undone!")
@@ -387,43 +806,42 @@ class DynamoDBDumper:
 
             print(f"🗑️  Truncating {entity_desc if entity_type else 'all items'} from table '{self.table_name}'...")
 
-            # Build scan parameters for deletion
-            scan_kwargs = {}
+            # Build scan parameters for deletion: only the keys are needed
+            scan_kwargs = {
+                'ProjectionExpression': '#pk, #sk',
+                'ExpressionAttributeNames': {'#pk': 'PK', '#sk': 'SK'}
+            }
             if entity_type:
-                entity_prefix = self.entity_types.get(entity_type.lower(), entity_type.upper())
-                scan_kwargs['FilterExpression'] = boto3.dynamodb.conditions.Attr('PK').begins_with(f"{entity_prefix}#")
-
-            # Delete items in batches
+                entity_filter = self._entity_filter(entity_type)
+                scan_kwargs['FilterExpression'] = entity_filter['FilterExpression']
+                scan_kwargs['ExpressionAttributeValues'] = entity_filter['ExpressionAttributeValues']
+                scan_kwargs['ExpressionAttributeNames'].update(entity_filter['ExpressionAttributeNames'])
+
+            # Delete segments in parallel, each worker batching its own deletes
+            progress_lock = threading.Lock()
+            progress = {'deleted': 0, 'reported': 0}
+
+            def on_deleted(n: int):
+                with progress_lock:
+                    progress['deleted'] += n
+                    if progress['deleted'] - progress['reported'] >= 1000:
+                        progress['reported'] = progress['deleted']
+                        print(f"• Deleted {progress['deleted']} items...")
+
+            client = self.dynamodb_client
             deleted_count = 0
-            last_evaluated_key = None
-
-            while True:
-                if last_evaluated_key:
-                    scan_kwargs['ExclusiveStartKey'] = last_evaluated_key
-
-                # Scan for items to delete
-                response = table.scan(**scan_kwargs)
-                items_to_delete = response.get('Items', [])
-
-                if not items_to_delete:
-                    break
-
-                # Delete items in batch
-                with table.batch_writer() as batch:
-                    for item in items_to_delete:
-                        batch.delete_item(
-                            Key={
-                                'PK': item['PK'],
-                                'SK': item['SK']
-                            }
-                        )
-                        deleted_count += 1
-
-                print(f"• Deleted {deleted_count} items...")
-
-                last_evaluated_key = response.get('LastEvaluatedKey')
-                if not last_evaluated_key:
-                    break
+            with ThreadPoolExecutor(max_workers=parallel_segments) as executor:
+                futures = [
+                    executor.submit(self._truncate_segment, client, scan_kwargs, segment,
+                                    parallel_segments, on_deleted, stop_event)
+                    for segment in range(parallel_segments)
+                ]
+                try:
+                    for future in as_completed(futures):
+                        deleted_count += future.result()
+                finally:
+                    # Stops the remaining workers after an error or Ctrl-C
+                    stop_event.set()
 
             print(f"✅ Successfully deleted {deleted_count} items from table '{self.table_name}'")
 
@@ -440,39 +858,36 @@ class DynamoDBDumper:
 
         # Collect all data organized by relationships
         users = {}
-        profiles = {}
-        media_items = {}
+        profiles = defaultdict(list)
+        media_items = defaultdict(list)
 
-        # First pass: collect all entities
-        print("• Scanning users...")
-        user_count = 0
-        for item in self.scan_table(entity_type="user", limit=limit):
-            # Only process user metadata items, not profile references
-            if item.get('SK') == 'METADATA':
-                user_id = item.get('PK', '').replace('USER#', '')
-                if user_id:
-                    users[user_id] = {
-                        'id': user_id,
-                        'email': item.get('platformMetadata', {}).get('username', 'N/A'),
-                        'platform': item.get('platform', 'N/A'),
-                        'created_at': item.get('createdAt', 'N/A'),
-                        'status': item.get('status', 'N/A')
-                    }
-                    user_count += 1
+        # Single pass: bucket every item by its PK/SK shape
+        print("• Scanning users, profiles and media...")
 
-        print("• Scanning profiles...")
-        profile_count = 0
+        def add_user(pk: str, sk: str, raw_item: Dict[str, Any]):
+            # Only process user metadata items, not profile references
+            if sk != 'METADATA' or (limit and len(users) >= limit):
+                return
+            item = _deserialize_item(raw_item)
+            user_id = pk[5:]  # strip 'USER#'
+            if user_id:
+                users[user_id] = {
+                    'id': user_id,
+                    'email': item.get('platformMetadata', {}).get('username', 'N/A'),
+                    'platform': item.get('platform', 'N/A'),
+                    'created_at': item.get('createdAt', 'N/A'),
+                    'status': item.get('status', 'N/A')
+                }
 
-        # Collect profiles and establish user-profile relationships using GSI1PK
-        for item in self.scan_table(entity_type="profile"):
-            if item.get('SK') == 'METADATA':
-                profile_id = item.get('PK', '').replace('PROFILE#', '')
+        def add_profile_item(pk: str, sk: str, raw_item: Dict[str, Any]):
+            profile_id = pk[8:]  # strip 'PROFILE#'
+            if sk == 'METADATA':
+                item = _deserialize_item(raw_item)
+                # Establish user-profile relationships using GSI1PK
                 user_gsi_pk = item.get('GSI1PK', '')  # This contains USER#user_id
-                user_id = user_gsi_pk.replace('USER#', '') if user_gsi_pk.startswith('USER#') else ''
+                user_id = user_gsi_pk[5:] if user_gsi_pk.startswith('USER#') else ''
 
                 if profile_id and user_id:
-                    if user_id not in profiles:
-                        profiles[user_id] = []
                     profiles[user_id].append({
                         'id': profile_id,
                         'name': item.get('nickName', 'N/A'),
@@ -480,17 +895,11 @@ class DynamoDBDumper:
                         'location': item.get('location', 'N/A'),
                         'position': item.get('sexualPosition', 'N/A')
                     })
-                    profile_count += 1
-
-        print("• Scanning media...")
-        media_count = 0
-        for item in self.scan_table():
-            if item.get('SK', '').startswith('MEDIA#'):
-                profile_id = item.get('PK', '').replace('PROFILE#', '')
-                media_id = item.get('SK', '').replace('MEDIA#', '')
+
+            elif sk.startswith('MEDIA#'):
+                item = _deserialize_item(raw_item)
+                media_id = sk[6:]  # strip 'MEDIA#'
                 if profile_id and media_id:
-                    if profile_id not in media_items:
-                        media_items[profile_id] = []
                     media_items[profile_id].append({
                         'id': media_id,
                         'type': item.get('mediaType', 'N/A'),
@@ -498,40 +907,39 @@ class DynamoDBDumper:
                         's3_key': item.get('s3Key', 'N/A'),
                         'created_at': item.get('createdAt', 'N/A')
                     })
-                    media_count += 1
 
+        # One dict lookup on the PK prefix replaces a chain of startswith tests. Keys are
+        # always strings, so they are read straight from the raw items and only the
+        # items that end up in the tree are deserialized.
+        handlers = {'USER#': add_user, 'PROFILE#': add_profile_item}
+        for raw_item in self.scan_table_raw(projection=TREE_ATTRIBUTES):
+            pk = raw_item['PK']['S']
+            handler = handlers.get(pk[:pk.find('#') + 1])
+            if handler:
+                handler(pk, raw_item['SK']['S'], raw_item)
+
+        user_count = len(users)
+        profile_count = sum(map(len, profiles.values()))
+        media_count = sum(map(len, media_items.values()))
         print(f"✅ Collected {user_count} users, {profile_count} profiles, {media_count} media items")
 
         # Build tree structure
-        tree_data = []
-        for user_id, user_data in users.items():
-            user_node = {
+        tree_data = [
+            {
                 'type': 'USER',
                 'data': user_data,
-                'profiles': []
-            }
-
-            # Add profiles for this user
-            user_profiles = profiles.get(user_id, [])
-            for profile_data in user_profiles:
-                profile_node = {
-                    'type': 'PROFILE',
-                    'data': profile_data,
-                    'media': []
-                }
-
-                # Add media for this profile
-                profile_media = media_items.get(profile_data['id'], [])
-                for media_data in profile_media:
-                    media_node = {
-                        'type': 'MEDIA',
-                        'data': media_data
+                'profiles': [
+                    {
+                        'type': 'PROFILE',
+                        'data': profile_data,
+                        'media': [{'type': 'MEDIA', 'data': media_data}
+                                  for media_data in media_items.get(profile_data['id'], ())]
                     }
-                    profile_node['media'].append(media_node)
-
-                user_node['profiles'].append(profile_node)
-
-            tree_data.append(user_node)
+                    for profile_data in profiles.get(user_id, ())
+                ]
+            }
+            for user_id, user_data in users.items()
+        ]
 
         # Output the tree
         if output_file:
@@ -575,8 +983,7 @@ class DynamoDBDumper:
             output_path = Path(output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(tree_data, f, indent=2, default=str)
+            _write_json(tree_data, output_path)
 
             print(f"✅ Tree structure saved to {output_path}")
         except Exception as e:
@@ -636,6 +1043,8 @@ Examples:
     dump_parser.add_argument('--output', help='Output file path')
     dump_parser.add_argument('--format', choices=['json', 'csv'], default='json', help='Output format')
     dump_parser.add_argument('--limit', type=int, help='Limit number of items to scan')
+    dump_parser.add_argument('--csv-fields', type=lambda value: value.split(','),
+                             help='Comma-separated CSV columns (writes rows in one pass without spooling)')
 
     # Counts command
     subparsers.add_parser('counts', help='List entity counts')
@@ -676,10 +1085,10 @@ Examples:
             dumper.dump_specific_entity(args.entity_type, args.entity_id, args.output, args.format)
         elif args.entity_type:
             # Dump entity type
-            dumper.dump_entity_type(args.entity_type, args.output, args.format, args.limit)
+            dumper.dump_entity_type(args.entity_type, args.output, args.format, args.limit, args.csv_fields)
         else:
             # Dump entire table
-            dumper.dump_entire_table(args.output, args.format, args.limit)
+            dumper.dump_entire_table(args.output, args.format, args.limit, args.csv_fields)
 
     elif args.command == 'counts':
         dumper.list_entity_counts()
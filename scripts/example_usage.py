@@ -5,22 +5,17 @@ Example usage of the mock user creation script
 This demonstrates how to use the script programmatically.
 """
 
-import json
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from scripts.create_mock_user import MockUserCreator, MockDataGenerator
-
 
 def example_create_multiple_users():
     """Example: Create multiple mock users"""
     print("Example: Creating multiple mock users")
     print("=" * 50)
     
+    from scripts.create_mock_user import MockUserCreator, MockDataGenerator
+
     # Configuration
     api_url = "https://api-dev.vibe-dating.io"
     bot_token = "your_bot_token_here"  # Replace with actual token
@@ -55,6 +50,8 @@ def example_custom_user_data():
     print("\nExample: Custom user data")
     print("=" * 30)
     
+    from scripts.create_mock_user import MockDataGenerator
+
     # Generate data
     telegram_user = MockDataGenerator.generate_telegram_user()
     profile_data = MockDataGenerator.generate_profile_data()
@@ -115,4 +112,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Add project root to path
+    project_root = Path(__file__).parent.parent
+    sys.path.insert(0, str(project_root))
+
     main()
\ No newline at end of file
@@ -9,45 +9,70 @@ for the Vibe Dating App backend services.
 import os
 import sys
 import argparse
-import boto3
-import base64
-import secrets
-import uuid
+import functools
+import importlib.util
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from botocore.exceptions import ClientError, NoCredentialsError
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Union
 
-# Set AWS profile
-os.environ["AWS_PROFILE"] = "vibe-dev"
+# SecretString values are str, SecretBinary values are bytes
+SecretValue = Union[str, bytes]
+
+# Seconds a retrieved secret value is reused within one process
+SECRET_CACHE_TTL = 300
+
+
+@functools.lru_cache(maxsize=None)
+def _client(region: str):
+    """Secrets Manager client shared by every SecretsManager in the process, per region"""
+    import boto3
+    return boto3.client('secretsmanager', region_name=region)
 
 
 class SecretsManager:
     """Manages AWS Secrets Manager for Vibe Dating App"""
     
     def __init__(self):
+        # Default AWS profile; one already set in the environment wins
+        os.environ.setdefault("AWS_PROFILE", "vibe-dev")
+
         self.project_root = Path(__file__).parent.parent
         self.region = os.getenv("AWS_REGION", "il-central-1")
         self.environment = os.getenv("ENVIRONMENT", "dev")
-        self.secrets_client = boto3.client('secretsmanager', region_name=self.region)
         
-        # Secret names
-        self.secret_names = {
+        # Secret names (read-only)
+        self.secret_names = MappingProxyType({
             "telegram_bot_token": f"vibe-dating/telegram-bot-token/{self.environment}",
             "jwt_secret": f"vibe-dating/jwt-secret/{self.environment}",
             "uuid_namespace": f"vibe-dating/uuid-namespace/{self.environment}"
-        }
+        })
+        self.secret_keys_csv = ", ".join(self.secret_names)
+
+        # Secret name -> (expiry on the monotonic clock, value)
+        self._secret_cache: Dict[str, tuple] = {}
+
+    @functools.cached_property
+    def secrets_client(self):
+        """Secrets Manager client, created on first use
+
+        boto3 is imported here so `--help` and argument errors never load it, and
+        check_prerequisites can report a missing install before anything imports it.
+        Methods import the botocore exceptions they catch for the same reason.
+        """
+        return _client(self.region)
         
     def check_prerequisites(self):
         """Check that all prerequisites are met"""
         print("• Checking prerequisites...")
         
-        # Check if AWS CLI is installed
-        try:
-            import boto3
-            print("• boto3 is available")
-        except ImportError:
+        # Check if boto3 is installed, without importing it
+        if importlib.util.find_spec('boto3') is None:
             print("❌ boto3 is not installed. Please install it first.")
             sys.exit(1)
+        print("• boto3 is available")
+        from botocore.exceptions import NoCredentialsError
             
         # Check AWS credentials
         try:
@@ -64,10 +89,12 @@ class SecretsManager:
         
     def generate_secure_secret(self, length: int = 32) -> str:
         """Generate a secure random secret"""
+        import secrets
         return secrets.token_urlsafe(length)
         
     def create_secret(self, secret_name: str, secret_value: str, description: str = "") -> bool:
         """Create a new secret in AWS Secrets Manager"""
+        from botocore.exceptions import ClientError
         try:
             response = self.secrets_client.create_secret(
                 Name=secret_name,
@@ -91,26 +118,49 @@ class SecretsManager:
                 
     def update_secret(self, secret_name: str, secret_value: str) -> bool:
         """Update an existing secret"""
+        from botocore.exceptions import ClientError
         try:
             response = self.secrets_client.update_secret(
                 SecretId=secret_name,
                 SecretString=secret_value
             )
+            self._secret_cache.pop(secret_name, None)
             print(f"• Updated secret: {secret_name}")
             return True
         except ClientError as e:
             print(f"❌ Failed to update secret {secret_name}: {e}")
             return False
             
-    def get_secret(self, secret_name: str) -> Optional[str]:
-        """Retrieve a secret value"""
+    @staticmethod
+    def _secret_value(entry: Dict[str, Any]) -> SecretValue:
+        """Value of a GetSecretValue response or BatchGetSecretValue entry"""
+        if 'SecretString' in entry:
+            return entry['SecretString']
+        else:
+            # Binary secrets: botocore already base64-decodes the blob, so it is returned as is
+            return entry['SecretBinary']
+
+    def _cached_secret(self, secret_name: str) -> Optional[SecretValue]:
+        """Value cached for secret_name, or None when absent or expired"""
+        cached = self._secret_cache.get(secret_name)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def _cache_secret(self, secret_name: str, secret_value: SecretValue):
+        self._secret_cache[secret_name] = (time.monotonic() + SECRET_CACHE_TTL, secret_value)
+
+    def get_secret(self, secret_name: str) -> Optional[SecretValue]:
+        """Retrieve a secret value, reusing one fetched within SECRET_CACHE_TTL"""
+        from botocore.exceptions import ClientError
+        cached = self._cached_secret(secret_name)
+        if cached is not None:
+            return cached
         try:
             response = self.secrets_client.get_secret_value(SecretId=secret_name)
-            if 'SecretString' in response:
-                return response['SecretString']
-            else:
-                # Handle binary secrets
-                return base64.b64decode(response['SecretBinary']).decode('utf-8')
+            secret_value = self._secret_value(response)
+            self._cache_secret(secret_name, secret_value)
+            return secret_value
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
                 print(f"⚠️  Secret not found: {secret_name}")
@@ -119,8 +169,50 @@ class SecretsManager:
                 print(f"❌ Failed to retrieve secret {secret_name}: {e}")
                 return None
                 
+    def _secret_exists(self, secret_name: str) -> bool:
+        """Check for a secret via its metadata, without fetching or decrypting the value"""
+        from botocore.exceptions import ClientError
+        try:
+            self.secrets_client.describe_secret(SecretId=secret_name)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ResourceNotFoundException':
+                print(f"❌ Failed to describe secret {secret_name}: {e}")
+            return False
+
+    def _batch_get(self, names: List[str]) -> Dict[str, Optional[SecretValue]]:
+        """Retrieve up to 20 secrets with one BatchGetSecretValue call, keyed by secret name"""
+        response = self.secrets_client.batch_get_secret_value(SecretIdList=names)
+        values = {entry['Name']: self._secret_value(entry) for entry in response.get('SecretValues', [])}
+        for secret_name, secret_value in values.items():
+            self._cache_secret(secret_name, secret_value)
+        for error in response.get('Errors', []):
+            if error['ErrorCode'] == 'ResourceNotFoundException':
+                print(f"⚠️  Secret not found: {error['SecretId']}")
+            else:
+                print(f"❌ Failed to retrieve secret {error['SecretId']}: {error.get('Message', error['ErrorCode'])}")
+        return values
+
+    def get_secrets(self) -> Dict[str, Optional[SecretValue]]:
+        """Retrieve every known secret, keyed like secret_names"""
+        from botocore.exceptions import ClientError
+        values = {name: self._cached_secret(name) for name in self.secret_names.values()}
+        names = [name for name, value in values.items() if value is None]
+        if names:
+            try:
+                values.update(self._batch_get(names))
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'AccessDeniedException':
+                    print(f"❌ Failed to retrieve secrets: {e}")
+                else:
+                    # Policies that only grant GetSecretValue: fetch one by one, concurrently
+                    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+                        values.update(zip(names, executor.map(self.get_secret, names)))
+        return {secret_key: values.get(secret_name) for secret_key, secret_name in self.secret_names.items()}
+
     def delete_secret(self, secret_name: str, force: bool = False) -> bool:
         """Delete a secret"""
+        from botocore.exceptions import ClientError
         try:
             if force:
                 # Force delete immediately
@@ -131,6 +223,7 @@ class SecretsManager:
             else:
                 # Schedule for deletion (7 days recovery window)
                 response = self.secrets_client.delete_secret(SecretId=secret_name)
+            self._secret_cache.pop(secret_name, None)
             print(f"• Deleted secret: {secret_name}")
             return True
         except ClientError as e:
@@ -139,11 +232,18 @@ class SecretsManager:
             
     def list_secrets(self, filter_prefix: str = "vibe-dating/") -> List[Dict[str, Any]]:
         """List all secrets with a specific prefix"""
+        from botocore.exceptions import ClientError
         try:
             secrets_list = []
             paginator = self.secrets_client.get_paginator('list_secrets')
-            
-            for page in paginator.paginate():
+
+            # The name filter is applied by AWS but matches case-insensitively, so
+            # the exact prefix check below stays
+            paginate_kwargs = {'PaginationConfig': {'PageSize': 100}}
+            if filter_prefix:
+                paginate_kwargs['Filters'] = [{'Key': 'name', 'Values': [filter_prefix]}]
+
+            for page in paginator.paginate(**paginate_kwargs):
                 for secret in page['SecretList']:
                     if secret['Name'].startswith(filter_prefix):
                         secrets_list.append({
@@ -163,6 +263,8 @@ class SecretsManager:
         print("🔧 Setting up core secrets...")
         
         results = {}
+        # (secret_key, secret_name, secret_value, description, exists) writes, sent after all prompts
+        pending = []
         
         # Core secrets that are required
         core_secrets = {
@@ -183,12 +285,15 @@ class SecretsManager:
             }
         }
         
+        # Check which secrets already exist, all at once, before asking anything
+        secret_names = [self.secret_names[secret_key] for secret_key in core_secrets]
+        with ThreadPoolExecutor(max_workers=len(secret_names)) as executor:
+            existing = dict(zip(core_secrets, executor.map(self._secret_exists, secret_names)))
+
         for secret_key, config in core_secrets.items():
             secret_name = self.secret_names[secret_key]
-            
-            # Check if secret already exists
-            existing_value = self.get_secret(secret_name)
-            if existing_value:
+            exists = existing[secret_key]
+            if exists:
                 print(f"⚠️  Secret already exists: {secret_name}")
                 if interactive:
                     update = input("Do you want to update it? (y/N): ").lower().strip()
@@ -202,6 +307,7 @@ class SecretsManager:
             # Get or generate secret value
             if config["generate"]:
                 if secret_key == "uuid_namespace":
+                    import uuid
                     secret_value = str(uuid.uuid4())
                     print(f"• Generated UUID namespace: {secret_value}")
                 else:
@@ -209,7 +315,9 @@ class SecretsManager:
                     print(f"• Generated secure {secret_key}: {secret_value[:20]}...")
             else:
                 if interactive:
-                    secret_value = input(f"Enter {secret_key}: ").strip()
+                    # Tokens are not echoed to the terminal
+                    import getpass
+                    secret_value = getpass.getpass(f"Enter {secret_key}: ").strip()
                     if not secret_value:
                         if config["required"]:
                             print(f"❌ {secret_key} is required")
@@ -224,15 +332,25 @@ class SecretsManager:
                     results[secret_key] = False
                     continue
             
-            # Create or update secret
-            if existing_value:
-                success = self.update_secret(secret_name, secret_value)
-            else:
-                success = self.create_secret(secret_name, secret_value, config["description"])
-            
-            results[secret_key] = success
+            # Reserve the summary position; the write happens below
+            results[secret_key] = False
+            pending.append((secret_key, secret_name, secret_value, config["description"], exists))
+
+        # Prompts are answered one by one above; the AWS writes are independent, so send them together
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                successes = executor.map(self._write_core_secret, pending)
+                for (secret_key, *_), success in zip(pending, successes):
+                    results[secret_key] = success
             
         return results
+
+    def _write_core_secret(self, pending_write: tuple) -> bool:
+        """Create or update one secret collected by setup_core_secrets"""
+        _, secret_name, secret_value, description, exists = pending_write
+        if exists:
+            return self.update_secret(secret_name, secret_value)
+        return self.create_secret(secret_name, secret_value, description)
         
     def export_secrets_to_env(self, output_file: str = None) -> bool:
         """Export secrets to environment variables or file"""
@@ -240,19 +358,19 @@ class SecretsManager:
         
         env_vars = {}
         
-        for secret_key, secret_name in self.secret_names.items():
-            secret_value = self.get_secret(secret_name)
+        for secret_key, secret_value in self.get_secrets().items():
             if secret_value:
                 # Convert to environment variable format
                 env_key = secret_key.upper().replace('-', '_')
+                if isinstance(secret_value, bytes):
+                    secret_value = secret_value.decode('utf-8', errors='replace')
                 env_vars[env_key] = secret_value
         
         if output_file:
             # Write to file
             try:
                 with open(output_file, 'w') as f:
-                    for key, value in env_vars.items():
-                        f.write(f"{key}={value}\n")
+                    f.write("".join(f"{key}={value}\n" for key, value in env_vars.items()))
                 print(f"• Exported secrets to {output_file}")
                 return True
             except Exception as e:
@@ -260,9 +378,9 @@ class SecretsManager:
                 return False
         else:
             # Print to console
-            print("Environment variables:")
-            for key, value in env_vars.items():
-                print(f"export {key}='{value}'")
+            lines = ["Environment variables:"]
+            lines.extend(f"export {key}='{value}'" for key, value in env_vars.items())
+            print("\n".join(lines))
             return True
             
     def validate_secrets(self) -> Dict[str, bool]:
@@ -271,8 +389,7 @@ class SecretsManager:
         
         results = {}
         
-        for secret_key, secret_name in self.secret_names.items():
-            secret_value = self.get_secret(secret_name)
+        for secret_key, secret_value in self.get_secrets().items():
             if secret_value:
                 print(f"• {secret_key}: Found")
                 results[secret_key] = True
@@ -301,12 +418,55 @@ class SecretsManager:
         return success
 
 
-def main():
-    """Main function for command-line interface"""
-    parser = argparse.ArgumentParser(
-        description="Secrets-Manager Management Script for Vibe Dating App",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+def _add_setup_parser(subparsers):
+    setup_parser = subparsers.add_parser('setup', help='Setup secrets')
+    setup_parser.add_argument('--non-interactive', action='store_true', help='Non-interactive mode')
+
+
+def _add_list_parser(subparsers):
+    list_parser = subparsers.add_parser('list', help='List all secrets')
+    list_parser.add_argument('--filter', default='vibe-dating/', help='Filter secrets by prefix')
+
+
+def _add_export_parser(subparsers):
+    export_parser = subparsers.add_parser('export', help='Export secrets')
+    export_parser.add_argument('--output', help='Output file path (default: print to console)')
+
+
+def _add_validate_parser(subparsers):
+    subparsers.add_parser('validate', help='Validate all secrets')
+
+
+def _add_rotate_parser(subparsers):
+    rotate_parser = subparsers.add_parser('rotate', help='Rotate a secret')
+    rotate_parser.add_argument('--secret', required=True, help='Secret key to rotate')
+
+
+def _add_delete_parser(subparsers):
+    delete_parser = subparsers.add_parser('delete', help='Delete a secret')
+    delete_parser.add_argument('--secret', required=True, help='Secret key to delete')
+    delete_parser.add_argument('--force', action='store_true', help='Force delete without recovery')
+
+
+def _add_get_parser(subparsers):
+    get_parser = subparsers.add_parser('get', help='Get a secret value')
+    get_parser.add_argument('--secret', required=True, help='Secret key to retrieve')
+
+
+# Subcommand name -> function registering its parser, in help order
+_SUBPARSER_BUILDERS = {
+    'setup': _add_setup_parser,
+    'list': _add_list_parser,
+    'export': _add_export_parser,
+    'validate': _add_validate_parser,
+    'rotate': _add_rotate_parser,
+    'delete': _add_delete_parser,
+    'get': _add_get_parser,
+}
+
+
+# Examples shown by the top-level --help
+_EPILOG = """
 Examples:
   # Setup core secrets interactively
   python scripts/secretsmanager_mgmt.py setup
@@ -329,38 +489,29 @@ Examples:
   # Delete a secret
   python scripts/secretsmanager_mgmt.py delete --secret telegram_bot_token
         """
-    )
+
+
+def main():
+    """Main function for command-line interface"""
+    argv = sys.argv[1:]
+    command = argv[0] if argv and argv[0] in _SUBPARSER_BUILDERS else None
+    if command and '-h' not in argv and '--help' not in argv:
+        # A plain command run never prints the overview, so skip its description and examples
+        parser = argparse.ArgumentParser(add_help=False)
+    else:
+        parser = argparse.ArgumentParser(
+            description="Secrets-Manager Management Script for Vibe Dating App",
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            epilog=_EPILOG
+        )
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Setup command
-    setup_parser = subparsers.add_parser('setup', help='Setup secrets')
-    setup_parser.add_argument('--non-interactive', action='store_true', help='Non-interactive mode')
-    
-    # List command
-    list_parser = subparsers.add_parser('list', help='List all secrets')
-    list_parser.add_argument('--filter', default='vibe-dating/', help='Filter secrets by prefix')
-    
-    # Export command
-    export_parser = subparsers.add_parser('export', help='Export secrets')
-    export_parser.add_argument('--output', help='Output file path (default: print to console)')
-    
-    # Validate command
-    subparsers.add_parser('validate', help='Validate all secrets')
-    
-    # Rotate command
-    rotate_parser = subparsers.add_parser('rotate', help='Rotate a secret')
-    rotate_parser.add_argument('--secret', required=True, help='Secret key to rotate')
-    
-    # Delete command
-    delete_parser = subparsers.add_parser('delete', help='Delete a secret')
-    delete_parser.add_argument('--secret', required=True, help='Secret key to delete')
-    delete_parser.add_argument('--force', action='store_true', help='Force delete without recovery')
-    
-    # Get command
-    get_parser = subparsers.add_parser('get', help='Get a secret value')
-    get_parser.add_argument('--secret', required=True, help='Secret key to retrieve')
-    
+
+    # Only the requested command's parser is built; help and unknown commands get all of them
+    for name, add_subparser in _SUBPARSER_BUILDERS.items():
+        if command is None or name == command:
+            add_subparser(subparsers)
+
     args = parser.parse_args()
     
     if not args.command:
@@ -387,13 +538,15 @@ Examples:
     elif args.command == 'list':
         secrets = secrets_manager.list_secrets(args.filter)
         if secrets:
-            print(f"\n• Found {len(secrets)} secrets:")
+            # One write for the whole listing instead of five prints per secret
+            lines = [f"\n• Found {len(secrets)} secrets:"]
             for secret in secrets:
-                print(f"  {secret['name']}")
-                print(f"    Description: {secret['description']}")
-                print(f"    Created: {secret['created']}")
-                print(f"    Environment: {secret['tags'].get('Environment', 'N/A')}")
-                print()
+                lines.append(f"  {secret['name']}")
+                lines.append(f"    Description: {secret['description']}")
+                lines.append(f"    Created: {secret['created']}")
+                lines.append(f"    Environment: {secret['tags'].get('Environment', 'N/A')}")
+                lines.append("")
+            print("\n".join(lines))
         else:
             print("No secrets found")
             
@@ -412,7 +565,7 @@ Examples:
     elif args.command == 'rotate':
         if args.secret not in secrets_manager.secret_names:
             print(f"❌ Unknown secret: {args.secret}")
-            print(f"Available secrets: {', '.join(secrets_manager.secret_names.keys())}")
+            print(f"Available secrets: {secrets_manager.secret_keys_csv}")
             sys.exit(1)
         
         secret_name = secrets_manager.secret_names[args.secret]
@@ -423,7 +576,7 @@ Examples:
     elif args.command == 'delete':
         if args.secret not in secrets_manager.secret_names:
             print(f"❌ Unknown secret: {args.secret}")
-            print(f"Available secrets: {', '.join(secrets_manager.secret_names.keys())}")
+            print(f"Available secrets: {secrets_manager.secret_keys_csv}")
             sys.exit(1)
         
         secret_name = secrets_manager.secret_names[args.secret]
@@ -434,14 +587,18 @@ Examples:
     elif args.command == 'get':
         if args.secret not in secrets_manager.secret_names:
             print(f"❌ Unknown secret: {args.secret}")
-            print(f"Available secrets: {', '.join(secrets_manager.secret_names.keys())}")
+            print(f"Available secrets: {secrets_manager.secret_keys_csv}")
             sys.exit(1)
         
         secret_name = secrets_manager.secret_names[args.secret]
         secret_value = secrets_manager.get_secret(secret_name)
         if secret_value:
             print(f"Secret value for {args.secret}:")
-            print(secret_value)
+            if isinstance(secret_value, bytes):
+                sys.stdout.flush()
+                sys.stdout.buffer.write(secret_value + b'\n')
+            else:
+                print(secret_value)
         else:
             sys.exit(1)
 
@@ -5,34 +5,57 @@ This script provides entry points for deploying/updating services infrastructure
 """
 
 import argparse
+import functools
+import os
+import sys
+from contextlib import contextmanager
 from pathlib import Path
 from importlib import import_module
 from typing import Optional
 
+SRC_PATH = str(Path(__file__).parent.parent / "src")
+
+
+@functools.cache
+def _services_for(task: str) -> list:
+    """Names of the services that provide a `{task}.py` module"""
+    with os.scandir(os.path.join(SRC_PATH, "services")) as entries:
+        return sorted(
+            entry.name
+            for entry in entries
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, f"{task}.py"))
+        )
+
+
+@contextmanager
+def _srcpath():
+    """Put src on sys.path for the duration of a task, if it isn't there already"""
+    # Service modules import `core.*` from src, which the installed `src` package doesn't expose
+    if SRC_PATH in sys.path:
+        yield
+        return
+    sys.path.insert(0, SRC_PATH)
+    try:
+        yield
+    finally:
+        sys.path.remove(SRC_PATH)
+
 
 def _execute(task: str, action: Optional[str] = None, service: Optional[str] = None):
-    services_list = [
-        p.parent.name
-        for p in Path(__file__).parent.parent.glob(f"src/services/*/{task}.py")
-    ]
-    
     if service is None:
         ap = argparse.ArgumentParser(description=f"Run {task} for services")
-        ap.add_argument("service", choices=services_list, help=f"Service to {task}")    
+        ap.add_argument("service", choices=_services_for(task), help=f"Service to {task}")
         args = ap.parse_args()
         service = args.service
     else:
-        if service not in services_list:
+        # A named service only needs its own task module checked, not a scan of all services
+        if not (Path(SRC_PATH) / "services" / service / f"{task}.py").is_file():
             raise ValueError(f"Unknown service: {service}")
 
     print(f"Running {task} for {service} service...")
-    # Add the src directory to the path so we can import from services
-    src_path = Path(__file__).parent.parent / "src"
-    import sys
-    sys.path.insert(0, str(src_path))
-    
-    task_main = import_module(f"services.{service}.{task}").main
-    task_main(action=action)
+    with _srcpath():
+        task_main = import_module(f"services.{service}.{task}").main
+        task_main(action=action)
 
 
 def build():
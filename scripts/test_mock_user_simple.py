@@ -3,6 +3,7 @@
 Simple test script for mock user creation functionality (no project dependencies)
 """
 
+import functools
 import hashlib
 import hmac
 import json
@@ -10,6 +11,13 @@ import random
 import time
 import urllib.parse
 
+
+@functools.lru_cache(maxsize=8)
+def _secret_key(bot_token):
+    """Derive the Telegram WebApp secret key for a bot token (cached per token)"""
+    return hmac.new(b"WebAppData", bot_token.encode(), hashlib.sha256).digest()
+
+
 class SimpleTelegramSignatureGenerator:
     """Simplified version for testing"""
     
@@ -25,31 +33,24 @@ class SimpleTelegramSignatureGenerator:
             "auth_date": str(auth_date)
         }
         
+        # Sort once; both the data check string and init_data are built from it
+        items = sorted(params.items())
+        
         # Create data check string
-        data_params_string = "\n".join(
-            f"{k}={v}" for k, v in sorted(params.items())
-        )
+        data_params_string = "\n".join(f"{k}={v}" for k, v in items)
         
         # Generate secret key
-        secret_key = hmac.new(
-            "WebAppData".encode(), bot_token.encode(), hashlib.sha256
-        ).digest()
+        secret_key = _secret_key(bot_token)
         
         # Calculate hash
         calculated_hash = hmac.new(
             secret_key, data_params_string.encode(), hashlib.sha256
         ).hexdigest()
         
-        # Add hash to params
-        params["hash"] = calculated_hash
-        
-        # URL encode the params
-        init_data_parts = []
-        for key, value in params.items():
-            encoded_value = urllib.parse.quote(value, safe="")
-            init_data_parts.append(f"{key}={encoded_value}")
-            
-        return "&".join(init_data_parts)
+        # URL encode the params with the hash appended
+        items.append(("hash", calculated_hash))
+        quote = urllib.parse.quote
+        return "&".join(f"{k}={quote(v, safe='')}" for k, v in items)
 
 
 class SimpleMockDataGenerator:
@@ -152,7 +153,7 @@ def test_signature_validation():
         )
         
         # Generate secret key and hash
-        secret_key = hmac.new("WebAppData".encode(), bot_token.encode(), hashlib.sha256).digest()
+        secret_key = _secret_key(bot_token)
         expected_hash = hmac.new(secret_key, data_params_string.encode(), hashlib.sha256).hexdigest()
         
         assert hash_value == expected_hash, "Hash validation failed"
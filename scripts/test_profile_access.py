@@ -4,7 +4,10 @@ Test profile access to debug media upload authorization
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 
 # Data from the last successful authentication
 api_url = "https://api.vibe-dating.io"
@@ -17,13 +20,29 @@ headers = {
     "Content-Type": "application/json"
 }
 
+# One session with a connection per concurrent request, kept alive between calls
+session = requests.Session()
+session.headers.update(headers)
+session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+# The two endpoint checks are independent: send both now, report them in order below
+executor = ThreadPoolExecutor(max_workers=2)
+profile_request = executor.submit(
+    session.get, f"{api_url}/profile/{profile_id}", timeout=30
+)
+# Try to get media for this profile (this should fail gracefully if no media exists)
+media_request = executor.submit(
+    session.options, f"{api_url}/profile/{profile_id}/media", timeout=30
+)
+executor.shutdown(wait=False)
+
 print(f"Testing access for user {user_id} to profile {profile_id}")
 print("=" * 60)
 
 # Test 1: Try to get the profile
 print("1. Testing profile access...")
 try:
-    response = requests.get(f"{api_url}/profile/{profile_id}", headers=headers, timeout=30)
+    response = profile_request.result()
     print(f"   Status: {response.status_code}")
     if response.status_code == 200:
         profile_data = response.json()
@@ -39,8 +58,7 @@ print()
 # Test 2: Try a simple media request
 print("2. Testing media endpoint access...")
 try:
-    # Try to get media for this profile (this should fail gracefully if no media exists)
-    response = requests.options(f"{api_url}/profile/{profile_id}/media", headers=headers, timeout=30)
+    response = media_request.result()
     print(f"   OPTIONS Status: {response.status_code}")
     print(f"   Headers: {dict(response.headers)}")
 except Exception as e:
@@ -5,15 +5,70 @@ This module contains common authentication functions used by both auth and user
 """
 
 import base64
-import datetime
 import os
+import time
 import uuid
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import jwt
 
 from core.aws import SecretsManagerService
 
+# Seconds a warm Lambda container reuses a secret before fetching it again
+SECRET_CACHE_TTL = 300
+
+# Issuer claim written by generate_jwt_token and required on verification
+JWT_ISSUER = "vibe-app"
+
+# Built once instead of per decode; every token we issue carries these claims
+_JWT_ALGORITHMS = ["HS256"]
+_JWT_DECODE_OPTIONS = {"require": ["exp", "iat", "iss"]}
+
+# Secret ARN -> (time fetched on the monotonic clock, secret value)
+_SECRET_CACHE: Dict[str, Tuple[float, str]] = {}
+
+
+def _get_cached_secret(secret_arn: str, ttl: float = SECRET_CACHE_TTL) -> str:
+    """
+    Get a secret from AWS Secrets Manager, reusing a value fetched within `ttl` seconds
+
+    Args:
+        secret_arn: ARN of the secret
+        ttl: Maximum age in seconds of a cached value
+
+    Returns:
+        str: Secret value (empty values are returned but not cached)
+    """
+    cached = _SECRET_CACHE.get(secret_arn)
+    now = time.monotonic()
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+
+    secret = SecretsManagerService.get_secret(secret_arn)
+    if secret:
+        _SECRET_CACHE[secret_arn] = (now, secret)
+    return secret
+
+
+def _get_jwt_secret() -> str:
+    """
+    Get the JWT signing secret named by the JWT_SECRET_ARN environment variable
+
+    Returns:
+        str: JWT secret
+
+    Raises:
+        Exception: If the variable is not set or the secret cannot be retrieved
+    """
+    jwt_secret_arn = os.environ.get("JWT_SECRET_ARN")
+    if not jwt_secret_arn:
+        raise Exception("JWT_SECRET_ARN environment variable not set")
+
+    secret = _get_cached_secret(jwt_secret_arn)
+    if not secret:
+        raise Exception("Failed to retrieve JWT secret from Secrets Manager")
+    return secret
+
 
 def extract_user_id_from_context(event: Dict[str, Any]) -> str:
     """
@@ -28,10 +83,11 @@ def extract_user_id_from_context(event: Dict[str, Any]) -> str:
     Raises:
         Exception: If user ID cannot be extracted
     """
-    request_context = event.get("requestContext", {})
-    authorizer = request_context.get("authorizer", {})
+    try:
+        user_id = event["requestContext"]["authorizer"]["uid"]
+    except (KeyError, TypeError):
+        user_id = None
 
-    user_id = authorizer.get("uid")
     if not user_id:
         raise Exception("User ID not found in request context")
 
@@ -49,22 +105,16 @@ def generate_jwt_token(signed_data: Dict[str, Any], expires_in: int = 7) -> str:
     Returns:
         str: JWT token string
     """
-    now = datetime.datetime.utcnow()
+    now = int(time.time())
     payload = {
         **signed_data,
-        "iat": int(now.timestamp()),
-        "exp": int((now + datetime.timedelta(days=expires_in)).timestamp()),
-        "iss": "vibe-app",
+        "iat": now,
+        "exp": now + expires_in * 86400,
+        "iss": JWT_ISSUER,
     }
 
-    # Get JWT secret from AWS Secrets Manager
-    jwt_secret_arn = os.environ.get("JWT_SECRET_ARN")
-    if not jwt_secret_arn:
-        raise Exception("JWT_SECRET_ARN environment variable not set")
-
-    secret = SecretsManagerService.get_secret(jwt_secret_arn)
-    if not secret:
-        raise Exception("Failed to retrieve JWT secret from Secrets Manager")
+    # Get JWT secret from AWS Secrets Manager (cached per warm container)
+    secret = _get_jwt_secret()
 
     return jwt.encode(payload, secret, algorithm="HS256")
 
@@ -83,15 +133,15 @@ def verify_jwt_token_with_secret_manager(token: str) -> Dict[str, Any]:
         Exception: If token is invalid or expired
     """
     try:
-        jwt_secret_arn = os.environ.get("JWT_SECRET_ARN")
-        if not jwt_secret_arn:
-            raise Exception("JWT_SECRET_ARN environment variable not set")
-
-        secret = SecretsManagerService.get_secret(jwt_secret_arn)
-        if not secret:
-            raise Exception("Failed to retrieve JWT secret from Secrets Manager")
-
-        payload = jwt.decode(token, secret, algorithms=["HS256"])
+        secret = _get_jwt_secret()
+
+        payload = jwt.decode(
+            token,
+            secret,
+            algorithms=_JWT_ALGORITHMS,
+            options=_JWT_DECODE_OPTIONS,
+            issuer=JWT_ISSUER,
+        )
         return payload
 
     except jwt.ExpiredSignatureError:
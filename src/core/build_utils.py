@@ -6,18 +6,132 @@ This module provides shared functionality for building Lambda layers and functio
 across different services in the Vibe Dating Backend.
 """
 
+import ctypes
+import ctypes.util
+import fnmatch
+import hashlib
 import json
 import os
 import shutil
 import subprocess
+import sys
 import zipfile
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path, PurePath
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from core.core_utils import ServiceConstructor
+from botocore.exceptions import ClientError
+
+from core.core_utils import ServiceConstructor, aws_client
 
 os.environ["AWS_PROFILE"] = "vibe-dev"
 
+ZIP_WRITE_BUFFER_SIZE = 1 << 16
+ZIP_COPY_BUFFER_SIZE = 1 << 20
+
+FICLONE = 0x40049409
+
+# Concurrent S3 uploads while building; packages upload as soon as they are zipped
+UPLOAD_WORKERS = 4
+
+
+def _load_clonefile():
+    """Return macOS clonefile(2) if available"""
+    if sys.platform != "darwin":
+        return None
+    try:
+        libsystem = ctypes.CDLL(ctypes.util.find_library("System"), use_errno=True)
+        clonefile = libsystem.clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+
+_clonefile = _load_clonefile()
+
+
+def _fast_copy(src: str, dst: str) -> str:
+    """Clone a file without moving its bytes through Python when possible
+
+    Tries a copy-on-write clone (clonefile on macOS, FICLONE on Linux), then a
+    hardlink, and finally falls back to shutil.copy2. Build directories are
+    scratch space, so sharing inodes with the source tree is safe.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if os.path.lexists(dst):
+        # Never write through an existing entry: it may be a hardlink to src
+        os.unlink(dst)
+
+    if _clonefile is not None:
+        if _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            return dst
+    elif sys.platform.startswith("linux"):
+        import fcntl
+
+        try:
+            with open(src, "rb") as src_f, open(dst, "wb") as dst_f:
+                fcntl.ioctl(dst_f.fileno(), FICLONE, src_f.fileno())
+            return dst
+        except OSError:
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+
+    try:
+        os.link(src, dst)
+        return dst
+    except OSError:
+        return shutil.copy2(src, dst)
+
+
+def _iter_tree(root: str, arc_prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """Yield (path, arcname) for every file under root using os.scandir
+
+    Symlinked directories are skipped, as os.walk did: following them could loop.
+    """
+    stack = [(root, arc_prefix)]
+    while stack:
+        dir_path, dir_arc = stack.pop()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                arc_name = dir_arc + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, arc_name + "/"))
+                elif entry.is_symlink() and entry.is_dir():
+                    print(f"⚠️  Warning: Skipping symlinked directory {entry.path}")
+                else:
+                    yield entry.path, arc_name
+
+
+def _latest_mtime(paths: List[Path]) -> float:
+    """Newest mtime among paths and, for directories, everything beneath them
+
+    Directory mtimes are included so deleting a source file also counts as a change.
+    """
+    latest = 0.0
+    stack = [str(path) for path in paths]
+    while stack:
+        path = stack.pop()
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        latest = max(latest, st.st_mtime)
+        if os.path.isdir(path):
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name == "__pycache__":
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        latest = max(latest, entry.stat(follow_symlinks=False).st_mtime)
+    return latest
+
 
 class ServiceBuilder(ServiceConstructor):
     """Common utilities for building Lambda packages"""
@@ -25,12 +139,67 @@ class ServiceBuilder(ServiceConstructor):
     def __init__(self, service: str, cfg: Dict[str, Any]):
         """Initialize build utilities with project root path"""
         super().__init__(service, cfg)
+        self.cache_dir = self.project_dir / ".cache"
+        self.pip_cache_dir = self.cache_dir / "pip"
+        self.layer_cache_dir = self.cache_dir / "layers"
+        # Shared extra files (packaged path -> source path) and their contents,
+        # so a module bundled into several functions is read only once
+        self._shared_files: Dict[str, Path] = {}
+        self._shared_file_data: Dict[Path, bytes] = {}
+        self._lambda_code_bucket: Optional[str] = None
+
+    def _pip_install_cmd(self, pkg_dir: Path) -> List[str]:
+        """Base pip command for installing into a Lambda package directory"""
+        return [
+            "pip",
+            "install",
+            "--no-compile",
+            "--disable-pip-version-check",
+            "--cache-dir",
+            str(self.pip_cache_dir),
+            "-t",
+            str(pkg_dir),
+        ]
+
+    @staticmethod
+    def _requirements_hash(requirements_files: List[Path]) -> str:
+        """Hash the contents of all files that determine a layer's packages"""
+        digest = hashlib.sha256()
+        for requirements_file in requirements_files:
+            if requirements_file.exists():
+                digest.update(requirements_file.name.encode())
+                digest.update(requirements_file.read_bytes())
+        return digest.hexdigest()
 
     def clean_previous_builds(self):
         print("• Cleaning previous builds...")
-        if self.build_dir.exists():
-            shutil.rmtree(self.build_dir)
         self.build_dir.mkdir(parents=True, exist_ok=True)
+        # Keep packaged zips so unchanged packages can be reused; drop staging trees
+        with os.scandir(self.build_dir) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                elif not entry.name.endswith(".zip"):
+                    os.unlink(entry.path)
+
+    def _build_inputs(self) -> List[Path]:
+        """Files whose change affects every package: the service build config and this module"""
+        service_module = sys.modules.get(type(self).__module__)
+        inputs = [Path(__file__)]
+        if service_module is not None and getattr(service_module, "__file__", None):
+            inputs.append(Path(service_module.__file__))
+        return inputs
+
+    def _package_is_current(self, pkg_file: Path, inputs: List[Path]) -> bool:
+        """True if pkg_file is newer than all of its inputs"""
+        try:
+            pkg_mtime = pkg_file.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        if pkg_mtime <= _latest_mtime(inputs + self._build_inputs()):
+            return False
+        print(f"• {pkg_file.name} is up to date, skipping build")
+        return True
 
     def install_python_packages(
         self, aws_layer_name: str, requirements_file: Path
@@ -41,14 +210,46 @@ class ServiceBuilder(ServiceConstructor):
         pkg_dir = self.build_dir / f"{aws_layer_name}" / "python"
         pkg_dir.mkdir(parents=True, exist_ok=True)
 
-        # Check if requirements.json exists, otherwise fall back to requirements.txt
+        # Reuse a previously installed layer when its requirements are unchanged
         requirements_json_file = requirements_file.parent / "requirements.json"
+        req_hash = self._requirements_hash(
+            [
+                requirements_json_file,
+                requirements_file,
+                requirements_file.parent / "requirements_pip_params.json",
+            ]
+        )
+        cached_dir = self.layer_cache_dir / f"{aws_layer_name}-{req_hash}"
+        if cached_dir.exists():
+            print(f"• Reusing cached layer packages: {cached_dir.name}")
+            shutil.copytree(
+                cached_dir, pkg_dir, copy_function=_fast_copy, dirs_exist_ok=True
+            )
+            return pkg_dir
+
+        # Check if requirements.json exists, otherwise fall back to requirements.txt
         if requirements_json_file.exists():
             print(f"• Using requirements.json: {requirements_json_file}")
-            return self._install_from_requirements_json(requirements_json_file, pkg_dir)
+            self._install_from_requirements_json(requirements_json_file, pkg_dir)
         else:
             print(f"• Using requirements.txt: {requirements_file}")
-            return self._install_from_requirements_txt(requirements_file, pkg_dir)
+            self._install_from_requirements_txt(requirements_file, pkg_dir)
+
+        self._store_layer_cache(pkg_dir, cached_dir)
+        return pkg_dir
+
+    def _store_layer_cache(self, pkg_dir: Path, cached_dir: Path) -> None:
+        """Save installed layer packages so unchanged requirements skip pip"""
+        tmp_dir = cached_dir.with_name(cached_dir.name + ".tmp")
+        try:
+            if tmp_dir.exists():
+                shutil.rmtree(tmp_dir)
+            cached_dir.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copytree(pkg_dir, tmp_dir, copy_function=_fast_copy)
+            tmp_dir.rename(cached_dir)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not cache layer packages: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
 
     def _install_from_requirements_json(self, requirements_json_file: Path, pkg_dir: Path) -> Path:
         """Install dependencies from requirements.json format"""
@@ -65,7 +266,7 @@ class ServiceBuilder(ServiceConstructor):
 
         # Install each package with its specific pip parameters
         for package_spec, pip_params in requirements_data.items():
-            cmd = ["pip", "install", package_spec, "-t", str(pkg_dir)]
+            cmd = self._pip_install_cmd(pkg_dir) + [package_spec]
             
             if isinstance(pip_params, list) and pip_params:
                 print(f"• Installing {package_spec} with parameters: {pip_params}")
@@ -109,7 +310,7 @@ class ServiceBuilder(ServiceConstructor):
             print(f"⚠️  Warning: Could not parse requirements file: {e}")
 
         # Install dependencies to the layer directory
-        cmd = ["pip", "install", "-r", str(requirements_file), "-t", str(pkg_dir)]
+        cmd = self._pip_install_cmd(pkg_dir) + ["-r", str(requirements_file)]
 
         # Add pip parameters for specific packages if specified
         for package_name in package_names:
@@ -139,83 +340,156 @@ class ServiceBuilder(ServiceConstructor):
         if exclude_patterns is None:
             exclude_patterns = ["__pycache__", "*.pyc", ".pytest_cache", "test"]
 
-        def should_copy(path: Path) -> bool:
+        def matches(path: str, name: str, pattern: str) -> bool:
+            """Path.match semantics, without building a Path for plain name patterns"""
+            if "/" in pattern:
+                return PurePath(path).match(pattern)
+            return fnmatch.fnmatchcase(name, pattern)
+
+        def should_copy(path: str, name: str) -> bool:
             """Check if a path should be copied based on patterns"""
             # Check include patterns
-            if not any(path.match(pattern) for pattern in include_patterns):
+            if not any(matches(path, name, pattern) for pattern in include_patterns):
                 return False
 
             # Check exclude patterns
-            if any(path.match(pattern) for pattern in exclude_patterns):
+            if any(matches(path, name, pattern) for pattern in exclude_patterns):
                 return False
 
             return True
 
-        def copy_directory(src: Path, dst: Path):
+        def copy_directory(src: str, dst: str):
             """Recursively copy directory with filtering"""
-            dst.mkdir(parents=True, exist_ok=True)
+            os.makedirs(dst, exist_ok=True)
 
-            for item in src.iterdir():
-                if item.is_file() and should_copy(item):
-                    shutil.copy2(item, dst / item.name)
-                elif item.is_dir() and should_copy(item):
-                    copy_directory(item, dst / item.name)
+            with os.scandir(src) as it:
+                for entry in it:
+                    if not should_copy(entry.path, entry.name):
+                        continue
+                    if entry.is_file():
+                        _fast_copy(entry.path, os.path.join(dst, entry.name))
+                    elif entry.is_dir():
+                        copy_directory(entry.path, os.path.join(dst, entry.name))
 
         if src_path.is_file():
-            if should_copy(src_path):
+            if should_copy(str(src_path), src_path.name):
                 dst_path.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src_path, dst_path)
+                _fast_copy(str(src_path), str(dst_path))
         else:
-            copy_directory(src_path, dst_path)
+            copy_directory(str(src_path), str(dst_path))
 
     def create_zip_package(
-        self, source_dir: Path, output_path: Path, base_path: Optional[Path] = None
+        self,
+        source_dir: Path,
+        output_path: Path,
+        base_path: Optional[Path] = None,
+        compression: int = zipfile.ZIP_DEFLATED,
+        compresslevel: Optional[int] = None,
     ) -> Path:
         """Create a ZIP package from a directory"""
         print(f"• Creating ZIP package: {output_path.name}")
 
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(source_dir):
-                for file in files:
-                    file_path = Path(root) / file
+        arc_prefix = ""
+        if base_path:
+            arc_prefix = source_dir.relative_to(base_path).as_posix() + "/"
+            if arc_prefix == "./":
+                arc_prefix = ""
 
-                    if base_path:
-                        arc_name = file_path.relative_to(base_path)
-                    else:
-                        arc_name = file_path.relative_to(source_dir)
-
-                    zipf.write(file_path, arc_name)
+        # Write next to the target and rename, so a failed build never leaves a
+        # fresh-looking partial zip that later builds would treat as current
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb", buffering=ZIP_WRITE_BUFFER_SIZE) as fp:
+                with zipfile.ZipFile(
+                    fp, "w", compression, compresslevel=compresslevel
+                ) as zipf:
+                    for file_path, arc_name in _iter_tree(str(source_dir), arc_prefix):
+                        self._write_zip_entry(zipf, file_path, arc_name)
+            os.replace(tmp_path, output_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
 
         size_kb = output_path.stat().st_size / 1024
         print(f"• Package created: {output_path.name} ({size_kb:.1f} KB)")
         return output_path
 
+    def _write_zip_entry(
+        self, zipf: zipfile.ZipFile, file_path: str, arc_name: str
+    ) -> None:
+        """Stream a file into the archive using large buffered reads"""
+        zinfo = zipfile.ZipInfo.from_file(file_path, arc_name)
+        zinfo.compress_type = zipf.compression
+
+        shared_src = self._shared_files.get(file_path)
+        if shared_src is not None:
+            data = self._shared_file_data.get(shared_src)
+            if data is None:
+                data = self._shared_file_data[shared_src] = shared_src.read_bytes()
+            zipf.writestr(zinfo, data, compresslevel=zipf.compresslevel)
+            return
+
+        if zipf.compresslevel is not None:
+            if not hasattr(zinfo, "compress_level"):
+                # Before Python 3.13 only ZipFile.write() applies a level to a streamed entry
+                zipf.write(file_path, arc_name)
+                return
+            zinfo.compress_level = zipf.compresslevel
+
+        with open(file_path, "rb", buffering=ZIP_COPY_BUFFER_SIZE) as src:
+            with zipf.open(zinfo, "w") as dst:
+                shutil.copyfileobj(src, dst, ZIP_COPY_BUFFER_SIZE)
+
     def create_aws_layer_package(self, aws_layer: Dict[str, Any]) -> Path:
         """Create a Lambda layer package"""
         pkg_file = self.build_dir / f"{aws_layer['name']}.zip"
         pkg_dir = self.build_dir / aws_layer["name"]
+        requirements_file = (
+            self.service_dir / "aws_lambdas" / aws_layer["requirements"]
+        )
+
+        requirements_dir = requirements_file.parent
+        if self._package_is_current(
+            pkg_file,
+            [
+                requirements_file,
+                requirements_dir / "requirements.json",
+                requirements_dir / "requirements_pip_params.json",
+            ],
+        ):
+            return pkg_file
+
         pkg_dir.mkdir(parents=True, exist_ok=True)
 
         # Install python packages
         self.install_python_packages(
             aws_layer_name=aws_layer["name"],
-            requirements_file=self.service_dir
-            / "aws_lambdas"
-            / aws_layer["requirements"],
+            requirements_file=requirements_file,
         )
 
-        # Create zip package
-        return self.create_zip_package(pkg_dir, pkg_file)
+        # Create zip package (fast DEFLATE keeps large dependency trees cheap to pack)
+        return self.create_zip_package(
+            pkg_dir, pkg_file, compression=zipfile.ZIP_DEFLATED, compresslevel=1
+        )
 
     def create_aws_lambda_package(self, aws_lambda: Dict[str, Any]) -> Path:
         """Create a Lambda function package"""
         pkg_file = self.build_dir / f"{aws_lambda['name']}.zip"
         pkg_dir = self.build_dir / aws_lambda["name"]
+        src_path = self.service_dir / "aws_lambdas" / aws_lambda["name"]
+
+        extra_files = [
+            self.project_dir / extra_file
+            for extra_file in aws_lambda.get("extra_files", [])
+        ]
+        if self._package_is_current(pkg_file, [src_path] + extra_files):
+            return pkg_file
+
         pkg_dir.mkdir(parents=True, exist_ok=True)
 
         # Copy function code
         self.copy_lambda_files(
-            src_path=self.service_dir / "aws_lambdas" / aws_lambda["name"],
+            src_path=src_path,
             dst_path=pkg_dir,
             include_patterns=aws_lambda.get("include_patterns", None),
             exclude_patterns=aws_lambda.get("exclude_patterns", None),
@@ -234,9 +508,11 @@ class ServiceBuilder(ServiceConstructor):
                 src_path=self.project_dir / extra_file,
                 dst_path=pkg_dir / extra_file_path,
             )
+            packaged_file = pkg_dir / extra_file_path / Path(extra_file).name
+            self._shared_files[str(packaged_file)] = self.project_dir / extra_file
 
-        # Create zip package
-        return self.create_zip_package(pkg_dir, pkg_file)
+        # Create zip package (function sources are small, so skip compression)
+        return self.create_zip_package(pkg_dir, pkg_file, compression=zipfile.ZIP_STORED)
 
     def print_build_summary(self, packages: List[Path]) -> None:
         """Print a summary of created packages"""
@@ -246,11 +522,50 @@ class ServiceBuilder(ServiceConstructor):
             print(f"  {package.name}: {size_kb:.1f} KB")
         print("\n✅ Build completed successfully!")
 
+    @property
+    def s3(self):
+        return aws_client("s3", self.region)
+
+    @property
+    def lambda_code_bucket(self) -> str:
+        # Resolved once per build rather than describing the core stack per upload
+        if self._lambda_code_bucket is None:
+            self._lambda_code_bucket = self.get_lambda_code_bucket_name()
+        return self._lambda_code_bucket
+
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
     def upload(self, src_file: Path):
-        """Upload Lambda ZIP file to S3 bucket"""
-        dst_file = f"s3://{self.get_lambda_code_bucket_name()}/lambda/{src_file.name}"
+        """Upload Lambda ZIP file to S3 bucket, skipping it if S3 already has the same content"""
+        bucket = self.lambda_code_bucket
+        key = f"lambda/{src_file.name}"
+        dst_file = f"s3://{bucket}/{key}"
+        sha256 = self._file_sha256(src_file)
+
+        try:
+            head = self.s3.head_object(Bucket=bucket, Key=key)
+            if head.get("Metadata", {}).get("sha256") == sha256:
+                print(f"• {dst_file} is up to date, skipping upload")
+                return
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code in ("403", "AccessDenied", "Forbidden"):
+                # Write-only deploy roles can't HEAD the object; just upload it
+                print(f"⚠️  Warning: Cannot read {dst_file} ({code}), uploading without skip check")
+            elif code not in ("404", "NoSuchKey", "NotFound"):
+                raise
+
         print(f"Uploading {src_file} to {dst_file}")
-        subprocess.run(["aws", "s3", "cp", str(src_file), str(dst_file)], check=True)
+        # S3 verifies a SHA-256 checksum of the streamed parts on its side as well
+        self.s3.upload_file(
+            str(src_file),
+            bucket,
+            key,
+            ExtraArgs={"Metadata": {"sha256": sha256}, "ChecksumAlgorithm": "SHA256"},
+        )
 
     def build(self, upload_to_s3: bool = True):
         """Main build process for service
@@ -264,21 +579,32 @@ class ServiceBuilder(ServiceConstructor):
         self.clean_previous_builds()
 
         packages = []
+        uploads: List[Future] = []
 
-        # Build layers
-        for aws_layer in self.cfg["aws_layers"]:
-            package_file = self.create_aws_layer_package(aws_layer)
-            packages.append(package_file)
-            if upload_to_s3:
-                self.upload(package_file)
-
-        # Build functions
-        for aws_lambda in self.cfg["aws_lambdas"]:
-            # Create function package
-            package_file = self.create_aws_lambda_package(aws_lambda)
-            packages.append(package_file)
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as upload_executor:
             if upload_to_s3:
-                self.upload(package_file)
+                # Resolve the bucket and create the S3 client before upload workers share them
+                print(f"• Uploading packages to s3://{self.lambda_code_bucket}/lambda/")
+                aws_client("s3", self.region)
+
+            # Build layers
+            for aws_layer in self.cfg["aws_layers"]:
+                package_file = self.create_aws_layer_package(aws_layer)
+                packages.append(package_file)
+                if upload_to_s3:
+                    uploads.append(upload_executor.submit(self.upload, package_file))
+
+            # Build functions
+            for aws_lambda in self.cfg["aws_lambdas"]:
+                # Create function package
+                package_file = self.create_aws_lambda_package(aws_lambda)
+                packages.append(package_file)
+                if upload_to_s3:
+                    uploads.append(upload_executor.submit(self.upload, package_file))
+
+            # Surface the first upload failure, as the sequential uploads did
+            for upload in uploads:
+                upload.result()
 
         # Print build summary
         self.print_build_summary(packages)
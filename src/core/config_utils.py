@@ -8,10 +8,9 @@ import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import boto3
 import yaml
 
-from core.core_utils import ServiceConstructor
+from core.core_utils import ServiceConstructor, aws_client
 
 os.environ["AWS_PROFILE"] = "vibe-dev"
 
@@ -32,7 +31,7 @@ class ServiceConfigUtils(ServiceConstructor):
         self.environment = environment or self.parameters["Environment"]
 
         # Setup AWS CloudFormation client
-        self.cf = boto3.client("cloudformation", region_name=self.region)
+        self.cf = aws_client("cloudformation", self.region)
 
         # Get service template directory
         self.template_dir = (
@@ -1,9 +1,18 @@
+import functools
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import yaml
 
 
+@functools.lru_cache(maxsize=None)
+def aws_client(service: str, region: Optional[str] = None):
+    """Shared boto3 client per (service, region); building one parses the service model"""
+    import boto3
+
+    return boto3.client(service, region_name=region)
+
+
 class ServiceConstructor:
     def __init__(self, service: str, cfg: Dict[str, Any]):
         self.service = service
@@ -4,20 +4,29 @@ Common deployment utilities for Vibe Dating App services.
 Provides a base ServiceDeployer class with shared CloudFormation deployment functionality.
 """
 
+import hashlib
+import json
 import os
 import subprocess
 import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import boto3
 import yaml
 
-from core.core_utils import ServiceConstructor
+from core.core_utils import ServiceConstructor, aws_client
 
 os.environ["AWS_PROFILE"] = "vibe-dev"
 
+# SSM parameter holding a hash of the template and inputs of a stack's last deploy.
+# Kept out of the stack tags, which CloudFormation copies onto every resource.
+DEPLOY_HASH_PARAMETER = "/vibe-dating/{environment}/deploy-hash/{stack_name}"
+
+# Stable states in which a matching deploy hash means the stack is current
+STACK_SETTLED_STATUSES = {"CREATE_COMPLETE", "UPDATE_COMPLETE", "IMPORT_COMPLETE"}
+
 
 class ServiceDeployer(ABC, ServiceConstructor):
     """Base class for deploying Vibe Dating App service infrastructure"""
@@ -46,8 +55,9 @@ class ServiceDeployer(ABC, ServiceConstructor):
         self.deployment_uuid = deployment_uuid or self.parameters["DeploymentUUID"]
 
         # Setup AWS session
-        self.cf = boto3.client("cloudformation", region_name=self.region)
-        self.s3 = boto3.client("s3", region_name=self.region)
+        self.cf = aws_client("cloudformation", self.region)
+        self.s3 = aws_client("s3", self.region)
+        self.ssm = aws_client("ssm", self.region)
 
         self.stack_outputs = {}
 
@@ -59,25 +69,43 @@ class ServiceDeployer(ABC, ServiceConstructor):
         """Get the environment for the service."""
         return self.environment
 
+    @staticmethod
+    def _check_aws_cli() -> Optional[str]:
+        try:
+            subprocess.run(["aws", "--version"], check=True, capture_output=True)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return "AWS CLI is not installed. Please install AWS CLI first."
+        return None
+
+    def _check_aws_credentials(self) -> Optional[str]:
+        try:
+            aws_client("sts", self.region).get_caller_identity()
+        except Exception as e:
+            return f"AWS credentials not configured: {e}"
+        return None
+
     def check_prerequisites(self, required_templates: List[str]):
         """Check that all prerequisites are met"""
         print("Checking prerequisites...")
 
-        # Check if AWS CLI is installed
-        try:
-            subprocess.run(["aws", "--version"], check=True, capture_output=True)
+        # The CLI and credential checks are independent network/process round-trips
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cli_check = executor.submit(self._check_aws_cli)
+            credentials_check = executor.submit(self._check_aws_credentials)
+
+            # Check if AWS CLI is installed
+            error = cli_check.result()
+            if error:
+                print(f"  {error}")
+                sys.exit(1)
             print("  AWS CLI is installed")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("  AWS CLI is not installed. Please install AWS CLI first.")
-            sys.exit(1)
 
-        # Check AWS credentials
-        try:
-            boto3.client("sts").get_caller_identity()
+            # Check AWS credentials
+            error = credentials_check.result()
+            if error:
+                print(f"  {error}")
+                sys.exit(1)
             print("  AWS credentials are configured")
-        except Exception as e:
-            print(f"  AWS credentials not configured: {e}")
-            sys.exit(1)
 
         # Check if template files exist
         for template in required_templates:
@@ -89,6 +117,53 @@ class ServiceDeployer(ABC, ServiceConstructor):
 
         print("  All prerequisites met")
 
+    @staticmethod
+    def _deploy_hash(
+        template_body: bytes, parameters: Dict[str, str], capabilities: List[str]
+    ) -> str:
+        """Hash everything `aws cloudformation deploy` is given for a stack"""
+        digest = hashlib.sha256(template_body)
+        digest.update(
+            json.dumps([parameters, sorted(capabilities)], sort_keys=True).encode()
+        )
+        return digest.hexdigest()
+
+    def _deploy_hash_parameter(self, stack_name: str) -> str:
+        return DEPLOY_HASH_PARAMETER.format(
+            environment=self.environment, stack_name=stack_name
+        )
+
+    def _stored_deploy_hash(self, stack_name: str) -> Optional[str]:
+        """Deploy hash recorded for a stack, or None if missing or unreadable"""
+        try:
+            response = self.ssm.get_parameter(
+                Name=self._deploy_hash_parameter(stack_name)
+            )
+            return response["Parameter"]["Value"]
+        except self.ssm.exceptions.ClientError:
+            return None
+
+    def _store_deploy_hash(self, stack_name: str, deploy_hash: str):
+        """Record a stack's deploy hash; failing to do so only costs a skip next time"""
+        try:
+            self.ssm.put_parameter(
+                Name=self._deploy_hash_parameter(stack_name),
+                Value=deploy_hash,
+                Type="String",
+                Overwrite=True,
+            )
+        except self.ssm.exceptions.ClientError as e:
+            print(f"  Could not record deploy hash for {stack_name}: {e}")
+
+    def _describe_stack(self, stack_name: str) -> Optional[Dict[str, Any]]:
+        """Describe a stack, or None if it does not exist"""
+        try:
+            return self.cf.describe_stacks(StackName=stack_name)["Stacks"][0]
+        except self.cf.exceptions.ClientError as e:
+            if "does not exist" in str(e):
+                return None
+            raise
+
     def deploy_stack(
         self,
         stack_name: str,
@@ -96,66 +171,76 @@ class ServiceDeployer(ABC, ServiceConstructor):
         parameters: Dict[str, Any] = None,
         capabilities: list = None,
     ) -> bool:
-        """Deploy a single CloudFormation stack."""
+        """Deploy a single CloudFormation stack.
+
+        Uses `aws cloudformation deploy`, which creates or updates the stack through a
+        change set and does nothing when the change set is empty. Stacks whose
+        recorded deploy hash (an SSM parameter, see DEPLOY_HASH_PARAMETER) already
+        matches the template and parameters are skipped without a change set at all.
+        """
         print(f"\nDeploying stack: {stack_name}")
 
         # Read template file
         template_path = self.template_dir / template_file
-        with open(template_path, "r") as f:
-            template_body = f.read()
+        template_body = template_path.read_bytes()
 
         # Prepare parameters
-        cf_parameters = []
-        if parameters:
-            for key, value in parameters.items():
-                cf_parameters.append(
-                    {"ParameterKey": key, "ParameterValue": str(value)}
-                )
+        cf_parameters = {key: str(value) for key, value in (parameters or {}).items()}
 
         # Prepare capabilities
         if not capabilities:
             capabilities = []
 
+        deploy_hash = self._deploy_hash(template_body, cf_parameters, capabilities)
+
         try:
-            # Check if stack exists
-            try:
-                self.cf.describe_stacks(StackName=stack_name)
-                stack_exists = True
+            stack = self._describe_stack(stack_name)
+            if stack is not None:
+                if (
+                    stack["StackStatus"] in STACK_SETTLED_STATUSES
+                    and self._stored_deploy_hash(stack_name) == deploy_hash
+                ):
+                    print(f"  Stack {stack_name} is up to date, skipping deploy")
+                    self.stack_outputs[stack_name] = {
+                        output["OutputKey"]: output["OutputValue"]
+                        for output in stack.get("Outputs", [])
+                    }
+                    return True
+                if stack["StackStatus"] == "ROLLBACK_COMPLETE":
+                    print(
+                        f"  Stack {stack_name} is in ROLLBACK_COMPLETE and must be "
+                        "deleted before it can be deployed"
+                    )
+                    return False
                 print(f"  Stack {stack_name} exists, updating...")
-            except self.cf.exceptions.ClientError as e:
-                if "does not exist" in str(e):
-                    stack_exists = False
-                    print(f"  Creating new stack {stack_name}...")
-                else:
-                    raise
-
-            if stack_exists:
-                # Update stack
-                response = self.cf.update_stack(
-                    StackName=stack_name,
-                    TemplateBody=template_body,
-                    Parameters=cf_parameters,
-                    Capabilities=capabilities,
-                    Tags=[
-                        {"Key": "Environment", "Value": self.environment},
-                        {"Key": "Service", "Value": self.service},
-                    ],
-                )
             else:
-                # Create stack
-                response = self.cf.create_stack(
-                    StackName=stack_name,
-                    TemplateBody=template_body,
-                    Parameters=cf_parameters,
-                    Capabilities=capabilities,
-                    Tags=[
-                        {"Key": "Environment", "Value": self.environment},
-                        {"Key": "Service", "Value": self.service},
-                    ],
-                )
+                print(f"  Creating new stack {stack_name}...")
+
+            cmd = [
+                "aws",
+                "cloudformation",
+                "deploy",
+                "--stack-name",
+                stack_name,
+                "--template-file",
+                str(template_path),
+                "--region",
+                self.region,
+                "--no-fail-on-empty-changeset",
+                "--tags",
+                f"Environment={self.environment}",
+                f"Service={self.service}",
+            ]
+            if cf_parameters:
+                cmd += ["--parameter-overrides"] + [
+                    f"{key}={value}" for key, value in cf_parameters.items()
+                ]
+            if capabilities:
+                cmd += ["--capabilities"] + list(capabilities)
 
             print(f"  Waiting for stack {stack_name} to complete...")
-            self._wait_for_stack(stack_name, stack_exists)
+            subprocess.run(cmd, check=True)
+            self._store_deploy_hash(stack_name, deploy_hash)
 
             # Always get stack outputs after update/create
             outputs = self._get_stack_outputs(stack_name)
@@ -165,30 +250,8 @@ class ServiceDeployer(ABC, ServiceConstructor):
             return True
 
         except Exception as e:
-            if "No updates are to be performed" in str(e):
-                print(f"  No updates needed for stack {stack_name}, continuing...")
-                # Always get stack outputs even if no update was performed
-                outputs = self._get_stack_outputs(stack_name)
-                self.stack_outputs[stack_name] = outputs
-                return True
-            else:
-                print(f"  Failed to deploy stack {stack_name}: {str(e)}")
-                return False
-
-    def _wait_for_stack(self, stack_name: str, stack_exists: bool):
-        """Wait for stack to complete."""
-        waiter_name = (
-            "stack_update_complete" if stack_exists else "stack_create_complete"
-        )
-        waiter = self.cf.get_waiter(waiter_name)
-        try:
-            waiter.wait(StackName=stack_name)
-        except Exception as e:
-            # Check if it's a no-update scenario
-            if "No updates are to be performed" in str(e):
-                print(f"  No updates needed for stack {stack_name}")
-                return
-            raise
+            print(f"  Failed to deploy stack {stack_name}: {str(e)}")
+            return False
 
     def _get_stack_outputs(self, stack_name: str) -> Dict[str, str]:
         """Get stack outputs."""
@@ -274,34 +337,49 @@ class ServiceDeployer(ABC, ServiceConstructor):
         print(f"\nAll {self.service} infrastructure stacks deployed successfully!")
         print(f"   Deployed stacks: {', '.join(deployed_stacks)}")
 
+    @staticmethod
+    def _validate_template(
+        template_path: Path,
+    ) -> Optional[subprocess.CalledProcessError]:
+        """Validate one template using AWS CLI"""
+        try:
+            subprocess.run(
+                [
+                    "aws",
+                    "cloudformation",
+                    "validate-template",
+                    "--template-body",
+                    f"file://{template_path}",
+                ],
+                check=True,
+                capture_output=True,
+            )
+        except subprocess.CalledProcessError as e:
+            return e
+        return None
+
     def validate_templates(self, templates: List[str]):
         """Validate CloudFormation templates"""
         print("🔍 Validating CloudFormation templates...")
 
+        template_paths = []
         for template in templates:
             template_path = self.template_dir / template
             if not template_path.exists():
                 print(f"❌ Template not found: {template_path}")
                 sys.exit(1)
+            template_paths.append(template_path)
+
+        # Each validation is a separate AWS CLI process; run them side by side
+        with ThreadPoolExecutor(max_workers=max(len(template_paths), 1)) as executor:
+            results = list(executor.map(self._validate_template, template_paths))
 
-            try:
-                # Validate template using AWS CLI
-                subprocess.run(
-                    [
-                        "aws",
-                        "cloudformation",
-                        "validate-template",
-                        "--template-body",
-                        f"file://{template_path}",
-                    ],
-                    check=True,
-                    capture_output=True,
-                )
-                print(f"✅ Template validated: {template}")
-            except subprocess.CalledProcessError as e:
+        for template, error in zip(templates, results):
+            if error:
                 print(f"❌ Template validation failed: {template}")
-                print(f"   Error: {e}")
+                print(f"   Error: {error}")
                 sys.exit(1)
+            print(f"✅ Template validated: {template}")
 
         print("✅ All templates validated successfully")
 
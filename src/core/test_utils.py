@@ -5,9 +5,11 @@ Poetry-based test script for Vibe Lambda Functions
 This script runs tests for the Lambda functions using Poetry for dependency management.
 """
 
+import hashlib
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -15,6 +17,11 @@ from core.core_utils import ServiceConstructor
 
 os.environ["AWS_PROFILE"] = "vibe-dev"
 
+# Flags for the test dependency install; part of the stamp so changing them reinstalls.
+# No --sync: it would also uninstall packages the tooling needs but pyproject.toml
+# does not declare (PyYAML for src/core), breaking build/deploy in the same env.
+POETRY_INSTALL_ARGS = ["--no-root", "--with", "lambda"]
+
 
 class ServiceTester(ServiceConstructor):
     def __init__(
@@ -54,134 +61,167 @@ class ServiceTester(ServiceConstructor):
 
         print("[PASS] All test prerequisites met")
 
+    def _poetry_env(self) -> Optional[str]:
+        """Identity of Poetry's virtualenv: its path plus when it was created
+
+        Returns None when the project has no environment yet.
+        """
+        try:
+            env_path = subprocess.run(
+                ["poetry", "env", "info", "--path"],
+                check=True,
+                capture_output=True,
+                text=True,
+                cwd=self.project_dir,
+            ).stdout.strip()
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        if not env_path:
+            return None
+
+        # A recreated virtualenv at the same path gets a new pyvenv.cfg
+        try:
+            created = (Path(env_path) / "pyvenv.cfg").stat().st_mtime_ns
+        except OSError:
+            created = 0
+        return f"{env_path}:{created}"
+
+    def _dependencies_hash(self, poetry_env: str) -> str:
+        """Hash of everything that decides what `poetry install` would do"""
+        digest = hashlib.sha256(" ".join(POETRY_INSTALL_ARGS).encode())
+        digest.update(poetry_env.encode())
+        for name in ("pyproject.toml", "poetry.lock"):
+            path = self.project_dir / name
+            if path.exists():
+                digest.update(path.read_bytes())
+        return digest.hexdigest()
+
     def install_test_dependencies(self):
-        """Install test dependencies using Poetry"""
+        """Install test dependencies using Poetry, unless the last install still applies
+
+        The stamp covers the lock file, pyproject.toml, the install flags and the
+        virtualenv, so a deleted or recreated environment is always reinstalled.
+        Delete the stamp to force a reinstall.
+        """
         print("• Installing test dependencies...")
 
+        stamp_file = self.project_dir / ".cache" / "poetry-install-stamp"
+        poetry_env = self._poetry_env()
+        if poetry_env is not None and stamp_file.exists():
+            if stamp_file.read_text() == self._dependencies_hash(poetry_env):
+                print("[PASS] Test dependencies are up to date")
+                return
+
         try:
             # Install lambda dependencies for testing (without installing the project itself)
             subprocess.run(
-                ["poetry", "install", "--no-root", "--with", "lambda"],
+                ["poetry", "install", *POETRY_INSTALL_ARGS],
                 check=True,
                 cwd=self.project_dir,
             )
+            # The install may have just created the virtualenv
+            poetry_env = self._poetry_env()
+            if poetry_env is not None:
+                stamp_file.parent.mkdir(parents=True, exist_ok=True)
+                stamp_file.write_text(self._dependencies_hash(poetry_env))
             print("[PASS] Test dependencies installed")
         except subprocess.CalledProcessError as e:
             print(f"[FAIL] Failed to install test dependencies: {e}")
             sys.exit(1)
 
-    def run_lambda_layer_test(self):
-        """Run Lambda layer test"""
-        test_file = self.test_dir / "test_layer.py"
+    def _run_test_script(self, file_name: str, label: str) -> bool:
+        """Run a standalone test script, streaming its output while it runs"""
+        test_file = self.test_dir / file_name
         if not test_file.exists():
-            print(f"⚠️  Lambda layer test not found: {test_file}. Skipping test.")
+            print(f"⚠️  {label} test not found: {test_file}. Skipping test.")
             return False
 
-        print("\n• Running Lambda layer test...")
-        try:
-            result = subprocess.run(
-                ["poetry", "run", "python", str(test_file)],
-                check=True,
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-            )
+        print(f"\n• Running {label} test...")
+        # stderr is merged so errors appear in order with the rest of the output;
+        # lines are tagged because the test phases run concurrently
+        with subprocess.Popen(
+            ["poetry", "run", "python", str(test_file)],
+            cwd=self.project_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        ) as process:
+            for line in process.stdout:
+                print(f"  [{label}] {line}", end="")
+
+        if process.returncode != 0:
+            print(f"[FAIL] {label} test failed (exit status {process.returncode})")
+            return False
 
-            print(result.stdout)
-            print("[PASS] Lambda layer test passed")
-            return True
+        print(f"[PASS] {label} test passed")
+        return True
 
-        except subprocess.CalledProcessError as e:
-            print(f"[FAIL] Lambda layer test failed:")
-            print(e.stdout)
-            print(e.stderr)
-            return False
+    def run_lambda_layer_test(self):
+        """Run Lambda layer test"""
+        return self._run_test_script("test_layer.py", "Lambda layer")
 
     def run_structure_test(self):
         """Run code structure test"""
-        test_file = self.test_dir / "test_structure.py"
-        if not test_file.exists():
-            print(f"⚠️  Structure test not found: {test_file}. Skipping test.")
-            return False
-
-        print("\n• Running code structure test...")
-        try:
-            result = subprocess.run(
-                ["poetry", "run", "python", str(test_file)],
-                check=True,
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-            )
-
-            print(result.stdout)
-            print("[PASS] Code structure test passed")
-            return True
-
-        except subprocess.CalledProcessError as e:
-            print(f"[FAIL] Code structure test failed:")
-            print(e.stdout)
-            print(e.stderr)
-            return False
+        return self._run_test_script("test_structure.py", "Code structure")
 
     def run_functional_test(self):
         """Run functional test"""
-        test_file = self.test_dir / "test_functional.py"
-        if not test_file.exists():
-            print(f"⚠️  Functional test not found: {test_file}. Skipping test.")
-            return False
-
-        print("\n• Running functional test...")
-        try:
-            result = subprocess.run(
-                ["poetry", "run", "python", str(test_file)],
-                check=True,
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-            )
-
-            print(result.stdout)
-            print("[PASS] Functional test passed")
-            return True
-
-        except subprocess.CalledProcessError as e:
-            print(f"[FAIL] Functional test failed:")
-            print(e.stdout)
-            print(e.stderr)
-            return False
+        return self._run_test_script("test_functional.py", "Functional")
 
     def run_linting(self):
         """Run code linting"""
         print("\n• Running code linting...")
 
-        try:
-            # Run black
-            print("  Running Black...")
-            subprocess.run(
-                ["poetry", "run", "black", "--check", str(self.service_dir)],
-                check=True,
-                cwd=self.project_dir,
-                capture_output=True,
-            )
-            print("  [PASS] Black passed")
+        linters = [
+            ("Black", ["poetry", "run", "black", "--check", str(self.service_dir)]),
+            ("isort", ["poetry", "run", "isort", "--check-only", str(self.service_dir)]),
+        ]
 
-            # Run isort
-            print("  Running isort...")
-            subprocess.run(
-                ["poetry", "run", "isort", "--check-only", str(self.service_dir)],
-                check=True,
-                cwd=self.project_dir,
-                capture_output=True,
-            )
-            print("  [PASS] isort passed")
+        try:
+            # Start every linter before waiting on any, so their Poetry start-ups overlap
+            processes = []
+            for name, command in linters:
+                print(f"  Running {name}...")
+                processes.append(
+                    (
+                        name,
+                        subprocess.Popen(
+                            command,
+                            cwd=self.project_dir,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE,
+                        ),
+                    )
+                )
+
+            passed = True
+            for name, process in processes:
+                process.communicate()
+                if process.returncode == 0:
+                    print(f"  [PASS] {name} passed")
+                else:
+                    print(f"  [FAIL] {name} exited with status {process.returncode}")
+                    passed = False
+
+        except OSError as e:
+            print(f"[FAIL] Linting failed: {e}")
+            return False
 
+        if passed:
             print("[PASS] All linting checks passed")
-            return True
+        else:
+            print("[FAIL] Linting failed")
+        return passed
 
-        except subprocess.CalledProcessError as e:
-            print(f"[FAIL] Linting failed: {e}")
-            return False
+    def _run_test(self, test):
+        """Run one (name, function) test, reporting an exception as a failure"""
+        test_name, test_func = test
+        try:
+            return test_name, test_func()
+        except Exception as e:
+            print(f"[FAIL] {test_name} test failed with exception: {e}")
+            return test_name, False
 
     def test(self):
         """Main test process"""
@@ -199,14 +239,9 @@ class ServiceTester(ServiceConstructor):
                 ("Linting", self.run_linting),
             ]
 
-            results = []
-            for test_name, test_func in tests:
-                try:
-                    result = test_func()
-                    results.append((test_name, result))
-                except Exception as e:
-                    print(f"[FAIL] {test_name} test failed with exception: {e}")
-                    results.append((test_name, False))
+            # Each test runs in its own subprocess, so they can all run at once
+            with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+                results = list(executor.map(self._run_test, tests))
 
             # Show summary
             print("\n• Test Summary:")
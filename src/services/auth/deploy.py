@@ -8,9 +8,8 @@ If infrastructure already exists, updates Lambda function code only.
 import argparse
 import sys
 
-import boto3
-
 from core.config_utils import ServiceConfigUtils
+from core.core_utils import aws_client
 from core.deploy_utils import ServiceDeployer
 
 
@@ -36,7 +35,7 @@ class AuthServiceDeployer(ServiceDeployer):
         print(f"    Parameters from core: {self.core_cfg}")
 
         # Initialize Lambda client for updates
-        self.lambda_client = boto3.client("lambda", region_name=self.region)
+        self.lambda_client = aws_client("lambda", self.region)
 
     def is_deployed(self) -> bool:
         """Check if auth infrastructure is already deployed"""
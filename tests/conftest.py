@@ -0,0 +1,38 @@
+"""
+Shared fixtures for the repository tests
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Two unrelated packages are both imported as `core`: the build/deploy tooling in
+# src/core and the Lambda layer in src/common/aws_lambdas/core
+CORE_PATHS = {
+    "tooling": PROJECT_ROOT / "src",
+    "lambda": PROJECT_ROOT / "src" / "common" / "aws_lambdas",
+}
+
+
+def _core_modules():
+    return [name for name in sys.modules if name == "core" or name.startswith("core.")]
+
+
+@pytest.fixture
+def import_core(monkeypatch):
+    """Import `core.<module>` from one of the `core` packages, isolated to the test"""
+    saved = {name: sys.modules.pop(name) for name in _core_modules()}
+
+    def _import(package: str, module: str):
+        monkeypatch.syspath_prepend(str(CORE_PATHS[package]))
+        return importlib.import_module(f"core.{module}")
+
+    yield _import
+
+    for name in _core_modules():
+        del sys.modules[name]
+    sys.modules.update(saved)
@@ -0,0 +1,116 @@
+"""
+Tests for JWT issuing and verification in src/common/aws_lambdas/core/auth_utils.py
+"""
+
+import time
+
+import jwt
+import pytest
+
+JWT_SECRET = "test-jwt-secret-at-least-32-bytes-long"
+JWT_SECRET_ARN = "arn:aws:secretsmanager:il-central-1:123456789012:secret:jwt"
+
+
+class FakeSecretsManagerClient:
+    """Stands in for the boto3 client used by SecretsManagerService"""
+
+    def __init__(self, secret: str):
+        self.secret = secret
+        self.calls = 0
+
+    def get_secret_value(self, SecretId: str):
+        self.calls += 1
+        return {"SecretString": self.secret}
+
+
+@pytest.fixture
+def secrets_client():
+    return FakeSecretsManagerClient(JWT_SECRET)
+
+
+@pytest.fixture
+def auth_utils(import_core, monkeypatch, secrets_client):
+    monkeypatch.setenv("JWT_SECRET_ARN", JWT_SECRET_ARN)
+    module = import_core("lambda", "auth_utils")
+    monkeypatch.setattr(module.SecretsManagerService, "secretsmanager", secrets_client)
+    return module
+
+
+def _token(claims, secret=JWT_SECRET):
+    return jwt.encode(claims, secret, algorithm="HS256")
+
+
+def _claims(**overrides):
+    now = int(time.time())
+    claims = {"uid": "user1234", "iat": now, "exp": now + 3600, "iss": "vibe-app"}
+    claims.update(overrides)
+    return {key: value for key, value in claims.items() if value is not None}
+
+
+def test_generated_token_verifies(auth_utils):
+    token = auth_utils.generate_jwt_token({"uid": "user1234"})
+
+    payload = auth_utils.verify_jwt_token_with_secret_manager(token)
+
+    assert payload["uid"] == "user1234"
+    assert payload["iss"] == auth_utils.JWT_ISSUER
+    assert payload["exp"] - payload["iat"] == 7 * 86400
+
+
+@pytest.mark.parametrize("claim", ["iat", "iss", "exp"])
+def test_missing_required_claim_is_rejected(auth_utils, claim):
+    token = _token(_claims(**{claim: None}))
+
+    with pytest.raises(Exception, match="Invalid token"):
+        auth_utils.verify_jwt_token_with_secret_manager(token)
+
+
+def test_wrong_issuer_is_rejected(auth_utils):
+    token = _token(_claims(iss="someone-else"))
+
+    with pytest.raises(Exception, match="Invalid token"):
+        auth_utils.verify_jwt_token_with_secret_manager(token)
+
+
+def test_foreign_audience_is_rejected(auth_utils):
+    token = _token(_claims(aud="another-service"))
+
+    with pytest.raises(Exception, match="Invalid token"):
+        auth_utils.verify_jwt_token_with_secret_manager(token)
+
+
+def test_expired_token_is_rejected(auth_utils):
+    now = int(time.time())
+    token = _token(_claims(iat=now - 7200, exp=now - 3600))
+
+    with pytest.raises(Exception, match="Token has expired"):
+        auth_utils.verify_jwt_token_with_secret_manager(token)
+
+
+def test_jwt_secret_is_cached_within_ttl_and_refreshed_after(
+    auth_utils, secrets_client, monkeypatch
+):
+    clock = [1000.0]
+    monkeypatch.setattr(auth_utils.time, "monotonic", lambda: clock[0])
+
+    assert auth_utils._get_jwt_secret() == JWT_SECRET
+    clock[0] += auth_utils.SECRET_CACHE_TTL - 1
+    assert auth_utils._get_jwt_secret() == JWT_SECRET
+    assert secrets_client.calls == 1
+
+    # A rotated secret is picked up once the cached value expires
+    secrets_client.secret = "rotated-jwt-secret-at-least-32-bytes"
+    clock[0] += 1
+    assert auth_utils._get_jwt_secret() == "rotated-jwt-secret-at-least-32-bytes"
+    assert secrets_client.calls == 2
+
+
+def test_empty_jwt_secret_is_not_cached(auth_utils, secrets_client):
+    secrets_client.secret = ""
+
+    with pytest.raises(Exception, match="Failed to retrieve JWT secret"):
+        auth_utils._get_jwt_secret()
+
+    secrets_client.secret = JWT_SECRET
+    assert auth_utils._get_jwt_secret() == JWT_SECRET
+    assert secrets_client.calls == 2
@@ -0,0 +1,177 @@
+"""
+Tests for Lambda packaging in src/core/build_utils.py
+"""
+
+import hashlib
+import os
+import time
+import zipfile
+
+import pytest
+from botocore.exceptions import ClientError
+
+
+@pytest.fixture
+def build_utils(import_core):
+    return import_core("tooling", "build_utils")
+
+
+@pytest.fixture
+def builder(build_utils):
+    return build_utils.ServiceBuilder("test", {"aws_layers": [], "aws_lambdas": []})
+
+
+def _zip_names(path):
+    with zipfile.ZipFile(path) as zipf:
+        return sorted(zipf.namelist())
+
+
+def test_iter_tree_skips_symlinked_directories(build_utils, tmp_path, capsys):
+    source = tmp_path / "src"
+    (source / "pkg").mkdir(parents=True)
+    (source / "pkg" / "module.py").write_text("x = 1\n")
+    (source / "linked_file.py").symlink_to(source / "pkg" / "module.py")
+    (source / "linked_dir").symlink_to(source / "pkg", target_is_directory=True)
+    # A link back to an ancestor would make a following walk loop forever
+    (source / "pkg" / "loop").symlink_to(source, target_is_directory=True)
+
+    entries = sorted(arc for _, arc in build_utils._iter_tree(str(source)))
+
+    assert entries == ["linked_file.py", "pkg/module.py"]
+    assert "Skipping symlinked directory" in capsys.readouterr().out
+
+
+def test_zip_package_with_symlinked_directory(builder, tmp_path):
+    source = tmp_path / "src"
+    (source / "pkg").mkdir(parents=True)
+    (source / "pkg" / "module.py").write_text("x = 1\n")
+    (source / "linked_dir").symlink_to(source / "pkg", target_is_directory=True)
+
+    package = builder.create_zip_package(source, tmp_path / "out.zip")
+
+    assert _zip_names(package) == ["pkg/module.py"]
+
+
+def test_package_is_current_compares_mtimes(builder, tmp_path):
+    source = tmp_path / "handler.py"
+    source.write_text("x = 1\n")
+    package = tmp_path / "handler.zip"
+    # Later than the build modules, which also count as inputs
+    future = time.time() + 3600
+
+    assert not builder._package_is_current(package, [source])
+
+    package.write_bytes(b"")
+    os.utime(source, (future, future))
+    os.utime(package, (future + 10, future + 10))
+    assert builder._package_is_current(package, [source])
+
+    os.utime(source, (future + 20, future + 20))
+    assert not builder._package_is_current(package, [source])
+
+
+@pytest.mark.parametrize(
+    "compression, compresslevel",
+    [(zipfile.ZIP_STORED, None), (zipfile.ZIP_DEFLATED, 1)],
+)
+def test_zip_package_round_trip(builder, tmp_path, compression, compresslevel):
+    source = tmp_path / "layer" / "python"
+    (source / "pkg").mkdir(parents=True)
+    files = {
+        "handler.py": b"def handler(event, context):\n    return event\n",
+        "pkg/data.bin": bytes(range(256)) * 64,
+        "pkg/empty.txt": b"",
+    }
+    for name, data in files.items():
+        (source / name).write_bytes(data)
+
+    package = builder.create_zip_package(
+        source,
+        tmp_path / "out.zip",
+        base_path=tmp_path / "layer",
+        compression=compression,
+        compresslevel=compresslevel,
+    )
+
+    with zipfile.ZipFile(package) as zipf:
+        assert zipf.testzip() is None
+        assert {info.compress_type for info in zipf.infolist()} == {compression}
+        assert {name: zipf.read(name) for name in zipf.namelist()} == {
+            f"python/{name}": data for name, data in files.items()
+        }
+
+
+class FakeS3Client:
+    """Stands in for the boto3 S3 client used by ServiceBuilder.upload"""
+
+    def __init__(self, head=None, error_code=None):
+        self.head = head or {}
+        self.error_code = error_code
+        self.uploads = []
+
+    def head_object(self, Bucket, Key):
+        if self.error_code:
+            raise ClientError(
+                {"Error": {"Code": self.error_code, "Message": ""}}, "HeadObject"
+            )
+        return self.head
+
+    def upload_file(self, Filename, Bucket, Key, ExtraArgs=None):
+        self.uploads.append((Filename, Bucket, Key, ExtraArgs))
+
+
+@pytest.fixture
+def package(tmp_path):
+    path = tmp_path / "auth.zip"
+    path.write_bytes(b"package contents")
+    return path
+
+
+def _upload_with(builder, monkeypatch, s3):
+    monkeypatch.setattr(type(builder), "s3", property(lambda self: s3))
+    builder._lambda_code_bucket = "lambda-code"
+
+
+def test_upload_skips_matching_sha256(builder, monkeypatch, package):
+    sha256 = hashlib.sha256(package.read_bytes()).hexdigest()
+    s3 = FakeS3Client(head={"Metadata": {"sha256": sha256}})
+    _upload_with(builder, monkeypatch, s3)
+
+    builder.upload(package)
+
+    assert s3.uploads == []
+
+
+@pytest.mark.parametrize(
+    "s3",
+    [
+        FakeS3Client(head={"Metadata": {"sha256": "stale"}}),
+        FakeS3Client(error_code="404"),
+        FakeS3Client(error_code="403"),
+    ],
+    ids=["mismatch", "missing", "forbidden"],
+)
+def test_upload_sends_package_with_sha256(builder, monkeypatch, package, s3):
+    sha256 = hashlib.sha256(package.read_bytes()).hexdigest()
+    _upload_with(builder, monkeypatch, s3)
+
+    builder.upload(package)
+
+    assert s3.uploads == [
+        (
+            str(package),
+            "lambda-code",
+            "lambda/auth.zip",
+            {"Metadata": {"sha256": sha256}, "ChecksumAlgorithm": "SHA256"},
+        )
+    ]
+
+
+def test_upload_raises_other_head_errors(builder, monkeypatch, package):
+    s3 = FakeS3Client(error_code="500")
+    _upload_with(builder, monkeypatch, s3)
+
+    with pytest.raises(ClientError):
+        builder.upload(package)
+
+    assert s3.uploads == []
@@ -0,0 +1,58 @@
+"""
+Tests for item deserialization and CSV flattening in scripts/dynamodb_mgmt.py
+"""
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from dynamodb_mgmt import _deserialize_item, _flatten_generic  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "key", ["plain", 'we"ird', "it's", "new\nline", "back\\slash", "{brace}"]
+)
+def test_flatten_with_cached_columns(key):
+    item = {
+        key: {"a": 1, "b": "x"},
+        f"{key}_list": [1, "two"],
+        f"{key}_str": "value",
+        f"{key}_num": Decimal("3"),
+    }
+    expected = {
+        f"{key}_a": "1",
+        f"{key}_b": "x",
+        f"{key}_list": "1, two",
+        f"{key}_str": "value",
+        f"{key}_num": "3",
+    }
+    column_cache = {}
+
+    assert _flatten_generic(item) == expected
+    assert _flatten_generic(item, column_cache) == expected
+    assert column_cache == {(key, ("a", "b")): [f"{key}_a", f"{key}_b"]}
+
+    # A second row with the same nested layout reuses the cached column list
+    item[key] = {"a": 2, "b": "y"}
+    assert _flatten_generic(item, column_cache)[f"{key}_a"] == "2"
+    assert len(column_cache) == 1
+
+
+def test_number_values_stay_exact():
+    item = _deserialize_item(
+        {
+            "age": {"N": "31"},
+            "offset": {"N": "-5"},
+            "lat": {"N": "32.0853000000000000000001"},
+            "big": {"N": "1E+2"},
+        }
+    )
+
+    assert item["age"] == 31 and type(item["age"]) is int
+    assert item["offset"] == -5
+    assert item["lat"] == Decimal("32.0853000000000000000001")
+    assert item["big"] == Decimal("100")